@@ -3,9 +3,14 @@ Dependency Injection Container
 Configura las dependencias para FastAPI
 Aplicando Dependency Injection y Singleton patterns
 """
-from functools import lru_cache
-from pathlib import Path
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import cache
+from typing import Optional, cast
+import threading
 
+from fastapi import Depends, HTTPException, Request
+
+from app.core.cache import TTLCache
 from app.core.config import get_settings
 from app.infrastructure.parsers.csv_parser import EvaluacionDataLoader
 from app.infrastructure.repositories.pandas_repository import (
@@ -13,78 +18,212 @@ from app.infrastructure.repositories.pandas_repository import (
     PandasPreguntaRepository,
 )
 from app.domain.repositories.i_repository import IEvaluacionRepository, IPreguntaRepository
+from app.domain.value_objects.periodo import Periodo
 from app.application.use_cases import (
     CalcularPromedioProfesorUseCase,
     ObtenerDetalleEvaluacionUseCase,
     ObtenerPropuestaMejoraUseCase,
+    ReporteProfesorUseCase,
 )
 
 
-# Singleton para repositorios (cargados una sola vez)
-_evaluacion_repo: IEvaluacionRepository | None = None
-_pregunta_repo: IPreguntaRepository | None = None
+# Resultado de la carga de datos, protegido por un lock: aunque la carga se
+# hace en el lifespan, si se invoca de forma concurrente los CSV se leen una vez
+_init_lock = threading.Lock()
+_repositorios: Optional[tuple[IEvaluacionRepository, IPreguntaRepository, str]] = None
 
 
-def initialize_repositories() -> None:
+def initialize_repositories() -> tuple[IEvaluacionRepository, IPreguntaRepository, str]:
     """
     Inicializa los repositorios cargando los datos CSV
-    Se llama una sola vez al inicio de la aplicación
+    Se llama una sola vez en el lifespan de la aplicación
     Carga automáticamente todos los archivos Evaluacion*.csv
-    """
-    global _evaluacion_repo, _pregunta_repo
-    
-    if _evaluacion_repo is not None and _pregunta_repo is not None:
-        return  # Ya inicializados
+    Es thread-safe: llamadas posteriores reutilizan los repositorios ya cargados
     
-    settings = get_settings()
-    
-    # Cargar datos usando el data loader
-    # Ahora pasa el directorio completo en lugar de un archivo específico
-    loader = EvaluacionDataLoader(
-        data_dir=settings.data_dir,
-        preguntas_path=settings.preguntas_file,
-    )
-    
-    evaluaciones, preguntas = loader.load_all()
+    Returns:
+        Tupla (repositorio de evaluaciones, repositorio de preguntas,
+        versión de los datos cargados)
+    """
+    global _repositorios
     
-    # Crear repositorios
-    _evaluacion_repo = PandasEvaluacionRepository(evaluaciones)
-    _pregunta_repo = PandasPreguntaRepository(preguntas)
+    with _init_lock:
+        if _repositorios is not None:
+            return _repositorios
+        
+        settings = get_settings()
+        
+        # Cargar datos usando el data loader
+        # Ahora pasa el directorio completo en lugar de un archivo específico
+        loader = EvaluacionDataLoader(
+            data_dir=settings.data_dir,
+            preguntas_path=settings.preguntas_file,
+            cache_dir=settings.data_dir / ".cache" if settings.enable_data_cache else None,
+        )
+        
+        evaluaciones, preguntas = loader.load_all()
+        
+        # Crear repositorios
+        _repositorios = (
+            PandasEvaluacionRepository(evaluaciones),
+            PandasPreguntaRepository(preguntas),
+            loader.data_version(),
+        )
+        return _repositorios
 
 
-def get_evaluacion_repository() -> IEvaluacionRepository:
+def get_evaluacion_repository(request: Request) -> IEvaluacionRepository:
     """
     Dependency provider para IEvaluacionRepository
-    Usado por FastAPI con Depends()
+    Usado por FastAPI con Depends(); el repositorio vive en app.state
+    (app.state no tiene tipos, de ahí los cast de estos providers)
     """
-    if _evaluacion_repo is None:
-        initialize_repositories()
-    return _evaluacion_repo  # type: ignore
+    return cast(IEvaluacionRepository, request.app.state.evaluacion_repo)
 
 
-def get_pregunta_repository() -> IPreguntaRepository:
+def get_pregunta_repository(request: Request) -> IPreguntaRepository:
     """Dependency provider para IPreguntaRepository"""
-    if _pregunta_repo is None:
-        initialize_repositories()
-    return _pregunta_repo  # type: ignore
+    return cast(IPreguntaRepository, request.app.state.pregunta_repo)
+
+
+def get_pdf_executor(request: Request) -> Executor:
+    """Dependency provider del pool de procesos para generar PDFs"""
+    return cast(Executor, request.app.state.pdf_executor)
+
+
+def get_pdf_cache(request: Request) -> Optional[TTLCache[bytes]]:
+    """Dependency provider de la cache de PDFs renderizados (None si está deshabilitada)"""
+    return cast(Optional[TTLCache[bytes]], request.app.state.pdf_cache)
+
+
+def get_data_version(request: Request) -> str:
+    """Dependency provider de la versión de los datos cargados"""
+    return cast(str, request.app.state.data_version)
+
+
+def _iniciar_worker_pdf() -> None:
+    """
+    Initializer de los procesos del pool de PDFs
+    ReportLab solo se importa en estos procesos (y en el principal al pedir
+    el primer PDF); se precalienta antes de la primera tarea
+    """
+    from app.infrastructure.services.pdf_generator import PDFGenerator
+    PDFGenerator.warm_up()
+
+
+def crear_pdf_executor() -> ProcessPoolExecutor:
+    """Pool de procesos para renderizar PDFs, con el tamaño de settings"""
+    settings = get_settings()
+    return ProcessPoolExecutor(
+        max_workers=settings.pdf_workers,
+        initializer=_iniciar_worker_pdf,
+    )
+
+
+def crear_cache_pdfs() -> Optional[TTLCache[bytes]]:
+    """
+    Cache TTL de PDFs ya renderizados, si está habilitado en settings
+    Se crea en cada carga de datos; la clave incluye además la versión
+    de los datos, así que un PDF nunca sobrevive a un cambio de los CSV
+    """
+    settings = get_settings()
+    if not settings.enable_cache:
+        return None
+    return TTLCache(maxsize=settings.pdf_cache_maxsize, ttl=settings.cache_ttl)
+
+
+def _tiene_evaluaciones(
+    repo: IEvaluacionRepository, documento: str, periodo: Optional[str]
+) -> bool:
+    """Indica si el profesor tiene evaluaciones (en el período, si se indica)"""
+    if periodo:
+        return Periodo.es_valido(periodo) and bool(
+            repo.find_by_profesor_and_periodo(documento, Periodo.from_string(periodo))
+        )
+    return bool(repo.find_by_profesor(documento))
+
+
+def get_cache_headers(
+    request: Request,
+    repo: IEvaluacionRepository = Depends(get_evaluacion_repository),
+) -> dict[str, str]:
+    """
+    Headers de cache HTTP para respuestas que dependen solo de los datos cargados
+    El ETag combina la versión de la aplicación y la de los datos, así un
+    deploy que cambia las respuestas lo invalida aunque los CSV sean los
+    mismos. Si el cliente ya lo tiene (If-None-Match) y el profesor existe,
+    se responde 304 sin recalcular ni serializar; si no existe, el endpoint
+    responde 404 como siempre
+    """
+    settings = get_settings()
+    if not settings.enable_cache:
+        return {}
+    
+    etag = f'"{settings.app_version}:{request.app.state.data_version}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.cache_ttl}",
+    }
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    etags_cliente = {
+        valor.strip().removeprefix("W/") for valor in if_none_match.split(",")
+    }
+    if (etag in etags_cliente or "*" in etags_cliente) and _tiene_evaluaciones(
+        repo,
+        request.path_params["documento"],
+        request.query_params.get("periodo"),
+    ):
+        raise HTTPException(status_code=304, headers=headers)
+    
+    return headers
+
+
+def _crear_cache_respuestas() -> Optional[TTLCache]:
+    """Cache TTL de respuestas de un use case, si está habilitado en settings"""
+    settings = get_settings()
+    if not settings.enable_cache:
+        return None
+    return TTLCache(maxsize=settings.cache_maxsize, ttl=settings.cache_ttl)
 
 
 # Use Cases factories
-def get_calcular_promedio_profesor_use_case():
+# Los repositorios son inmutables durante la vida del proceso, así que cada
+# use case se construye una sola vez por repositorio (functools.cache) y se reutiliza
+# entre requests
+@cache
+def get_calcular_promedio_profesor_use_case(
+    evaluacion_repo: IEvaluacionRepository = Depends(get_evaluacion_repository),
+) -> CalcularPromedioProfesorUseCase:
     """Factory para el use case de promedio de profesor"""
-    evaluacion_repo = get_evaluacion_repository()
     return CalcularPromedioProfesorUseCase(evaluacion_repo)
 
 
-def get_detalle_evaluacion_use_case():
+@cache
+def get_detalle_evaluacion_use_case(
+    evaluacion_repo: IEvaluacionRepository = Depends(get_evaluacion_repository),
+    pregunta_repo: IPreguntaRepository = Depends(get_pregunta_repository),
+) -> ObtenerDetalleEvaluacionUseCase:
     """Factory para ObtenerDetalleEvaluacionUseCase"""
-    evaluacion_repo = get_evaluacion_repository()
-    pregunta_repo = get_pregunta_repository()
-    return ObtenerDetalleEvaluacionUseCase(evaluacion_repo, pregunta_repo)
+    return ObtenerDetalleEvaluacionUseCase(
+        evaluacion_repo, pregunta_repo, cache=_crear_cache_respuestas()
+    )
 
 
-def get_propuesta_mejora_use_case():
+@cache
+def get_propuesta_mejora_use_case(
+    evaluacion_repo: IEvaluacionRepository = Depends(get_evaluacion_repository),
+    pregunta_repo: IPreguntaRepository = Depends(get_pregunta_repository),
+) -> ObtenerPropuestaMejoraUseCase:
     """Factory para ObtenerPropuestaMejoraUseCase"""
-    evaluacion_repo = get_evaluacion_repository()
-    pregunta_repo = get_pregunta_repository()
-    return ObtenerPropuestaMejoraUseCase(evaluacion_repo, pregunta_repo)
+    return ObtenerPropuestaMejoraUseCase(
+        evaluacion_repo, pregunta_repo, cache=_crear_cache_respuestas()
+    )
+
+
+@cache
+def get_reporte_profesor_use_case(
+    evaluacion_repo: IEvaluacionRepository = Depends(get_evaluacion_repository),
+    pregunta_repo: IPreguntaRepository = Depends(get_pregunta_repository),
+) -> ReporteProfesorUseCase:
+    """Factory para ReporteProfesorUseCase"""
+    return ReporteProfesorUseCase(evaluacion_repo, pregunta_repo)
@@ -1,12 +1,14 @@
 """
 Pydantic schemas para detalle de evaluaciones
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
 class RespuestaPreguntaSchema(BaseModel):
     """Schema para una respuesta individual"""
+    model_config = ConfigDict(frozen=True)
+    
     codigo_pregunta: str
     texto_pregunta: str
     categoria: str
@@ -16,6 +18,8 @@ class RespuestaPreguntaSchema(BaseModel):
 
 class DetalleEvaluacionResponse(BaseModel):
     """Schema para respuesta de detalle de evaluaciones"""
+    model_config = ConfigDict(frozen=True)
+    
     documento: str
     nombre_completo: str
     periodo: Optional[str]
@@ -1,12 +1,14 @@
 """
 Pydantic schemas para propuestas de mejora
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
 class RecomendacionMejoraSchema(BaseModel):
     """Schema para una recomendación de mejora"""
+    model_config = ConfigDict(frozen=True)
+    
     codigo_pregunta: str
     texto_pregunta: str
     calificacion_promedio: float
@@ -15,6 +17,8 @@ class RecomendacionMejoraSchema(BaseModel):
 
 class MejoraPorCategoriaSchema(BaseModel):
     """Schema para mejora por categoría"""
+    model_config = ConfigDict(frozen=True)
+    
     categoria: str
     promedio_categoria: float
     recomendaciones: list[RecomendacionMejoraSchema]
@@ -22,6 +26,8 @@ class MejoraPorCategoriaSchema(BaseModel):
 
 class PropuestaMejoraResponse(BaseModel):
     """Schema para respuesta de propuesta de mejora"""
+    model_config = ConfigDict(frozen=True)
+    
     documento: str
     nombre_completo: str
     periodo: Optional[str]
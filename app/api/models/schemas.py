@@ -1,38 +1,37 @@
 """
 Pydantic Schemas para la API
 Validación automática de requests/responses
+Los schemas de response describen datos generados por el servidor: no
+repiten validaciones de rango y son inmutables
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 
 class PromedioCategoriaSchema(BaseModel):
     """Schema para promedio de categoría"""
+    model_config = ConfigDict(frozen=True)
+    
     categoria: str
     categoria_corta: str
-    promedio: float = Field(ge=0, le=5, description="Promedio entre 0 y 5")
-    total_evaluaciones: int = Field(ge=0)
+    promedio: float = Field(description="Promedio entre 0 y 5")
+    total_evaluaciones: int
 
 
 class PromedioActorSchema(BaseModel):
     """Schema para promedio por actor"""
+    model_config = ConfigDict(frozen=True)
+    
     actor: str
-    promedio: float = Field(ge=0, le=5)
-    total_evaluaciones: int = Field(ge=0)
+    promedio: float = Field(description="Promedio entre 0 y 5")
+    total_evaluaciones: int
 
 
 class PromedioProfesorResponse(BaseModel):
     """Response schema para promedio de profesor"""
-    documento: str
-    nombre_completo: str
-    periodo: Optional[str] = None
-    promedio_general: float = Field(ge=0, le=5)
-    total_evaluaciones: int = Field(ge=0)
-    promedios_por_categoria: list[PromedioCategoriaSchema]
-    promedios_por_actor: list[PromedioActorSchema]
-    
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "documento": "1140844852",
                 "nombre_completo": "JAIME ENRIQUE MONCADA DIAZ",
@@ -60,11 +59,22 @@ class PromedioProfesorResponse(BaseModel):
                     }
                 ]
             }
-        }
+        },
+    )
+    
+    documento: str
+    nombre_completo: str
+    periodo: Optional[str] = None
+    promedio_general: float = Field(description="Promedio entre 0 y 5")
+    total_evaluaciones: int
+    promedios_por_categoria: list[PromedioCategoriaSchema]
+    promedios_por_actor: list[PromedioActorSchema]
 
 
 class ProfesorListItem(BaseModel):
     """Schema para item en lista de profesores"""
+    model_config = ConfigDict(frozen=True)
+    
     documento: str
     nombre_completo: str
     total_evaluaciones: int
@@ -72,6 +82,8 @@ class ProfesorListItem(BaseModel):
 
 class PeriodoListItem(BaseModel):
     """Schema para período en lista"""
+    model_config = ConfigDict(frozen=True)
+    
     periodo: str
     total_evaluaciones: int
 
@@ -1,58 +1,64 @@
 """
 Routes para estadísticas generales
 """
-from fastapi import APIRouter, Depends
+from functools import cache
+from typing import Any
+
+from fastapi import APIRouter, Depends, Response
+from pydantic import TypeAdapter
 
 from app.api.dependencies import get_evaluacion_repository
 from app.api.models.schemas import PeriodoListItem
+from app.domain.repositories.i_repository import IEvaluacionRepository
 
 
 router = APIRouter(prefix="/estadisticas", tags=["estadisticas"])
 
+_PERIODOS_ADAPTER = TypeAdapter(list[PeriodoListItem])
+_ACTORES_ADAPTER = TypeAdapter(list[dict[str, Any]])
+
+
+# Los repositorios son inmutables: cada listado se serializa una sola vez
+# por repositorio y se reutilizan los bytes JSON en los siguientes requests
+@cache
+def _periodos_json(repo: IEvaluacionRepository) -> bytes:
+    """Listado de períodos serializado a JSON"""
+    return _PERIODOS_ADAPTER.dump_json([
+        PeriodoListItem(periodo=str(periodo), total_evaluaciones=total)
+        for periodo, total in repo.count_by_periodo().items()
+    ])
+
+
+@cache
+def _actores_json(repo: IEvaluacionRepository) -> bytes:
+    """Listado de actores serializado a JSON"""
+    return _ACTORES_ADAPTER.dump_json([
+        {"actor": actor, "total_evaluaciones": total}
+        for actor, total in repo.count_by_tipo_formulario().items()
+    ])
+
 
 @router.get("/periodos", response_model=list[PeriodoListItem])
 async def listar_periodos(
     repo = Depends(get_evaluacion_repository),
-) -> list[PeriodoListItem]:
+) -> Response:
     """
     Lista todos los períodos disponibles con evaluaciones
     
     Returns:
         Lista de períodos ordenados cronológicamente
     """
-    periodos = repo.get_periodos_disponibles()
-    
-    result = []
-    for periodo in periodos:
-        evaluaciones = repo.find_by_periodo(periodo)
-        result.append(
-            PeriodoListItem(
-                periodo=str(periodo),
-                total_evaluaciones=len(evaluaciones),
-            )
-        )
-    
-    return result
+    return Response(content=_periodos_json(repo), media_type="application/json")
 
 
-@router.get("/actores")
+@router.get("/actores", response_model=list[dict])
 async def listar_actores(
     repo = Depends(get_evaluacion_repository),
-) -> list[dict]:
+) -> Response:
     """
     Lista todos los tipos de actores evaluadores
     
     Returns:
         Lista de actores (tipos de formulario)
     """
-    actores = repo.get_tipos_formulario()
-    
-    result = []
-    for actor in actores:
-        evaluaciones = repo.find_by_tipo_formulario(actor)
-        result.append({
-            "actor": actor,
-            "total_evaluaciones": len(evaluaciones),
-        })
-    
-    return result
+    return Response(content=_actores_json(repo), media_type="application/json")
@@ -2,18 +2,33 @@
 Routes para Profesores
 Endpoints relacionados con consultas de profesores
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
-from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from functools import cache
+from pydantic import TypeAdapter
+from typing import IO, Optional, cast
+from collections import deque
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
+from itertools import islice
+import asyncio
 import io
+import logging
+import os
+import orjson
 import zipfile
 from datetime import datetime
 
 from app.api.dependencies import (
+    get_cache_headers,
     get_calcular_promedio_profesor_use_case,
+    get_data_version,
     get_evaluacion_repository,
     get_detalle_evaluacion_use_case,
     get_propuesta_mejora_use_case,
+    get_pdf_cache,
+    get_pdf_executor,
+    get_reporte_profesor_use_case,
 )
 from app.api.models.schemas import PromedioProfesorResponse, ProfesorListItem
 from app.api.models.detalle_schemas import DetalleEvaluacionResponse
@@ -21,44 +36,108 @@ from app.api.models.mejora_schemas import PropuestaMejoraResponse
 from app.application.dtos.profesor_dtos import PromedioProfesorRequest
 from app.application.dtos.detalle_dtos import DetalleEvaluacionRequest
 from app.application.dtos.mejora_dtos import PropuestaMejoraRequest
+from app.application.dtos.reporte_dtos import ReporteProfesorRequest, ReporteProfesorResponse
+from app.application.use_cases import ReporteProfesorUseCase
+from app.core.cache import TTLCache
+from app.core.config import Settings, get_settings
 from app.core.exceptions import ProfesorNotFoundError
-from app.infrastructure.services.pdf_generator import PDFGenerator
+from app.domain.repositories.i_repository import IEvaluacionRepository
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/profesores", tags=["profesores"])
 
 
+class _ZipStreamBuffer(io.RawIOBase):
+    """
+    Destino de escritura no seekable para zipfile
+    Acumula los bytes escritos hasta que se consumen con drain(), de modo que
+    el ZIP se puede enviar por partes sin mantenerlo completo en memoria
+    """
+    
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data: bytes | bytearray | memoryview) -> int:  # type: ignore[override]
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def drain(self) -> bytes:
+        """Retorna y descarta los bytes pendientes"""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+_PROFESORES_ADAPTER = TypeAdapter(list[ProfesorListItem])
+
+
+@cache
+def _profesores_json(repo: IEvaluacionRepository) -> bytes:
+    """
+    Listado de profesores serializado a JSON
+    El repositorio es inmutable, así que se serializa una sola vez
+    """
+    return _PROFESORES_ADAPTER.dump_json([
+        ProfesorListItem(
+            documento=p.documento,
+            nombre_completo=p.nombre_completo,
+            total_evaluaciones=p.total_evaluaciones(),
+        )
+        for p in repo.get_profesores()
+    ])
+
+
 @router.get("/", response_model=list[ProfesorListItem])
 async def listar_profesores(
     repo = Depends(get_evaluacion_repository),
-) -> list[ProfesorListItem]:
+) -> Response:
     """
     Lista todos los profesores evaluados
     
     Returns:
         Lista de profesores con su información básica
     """
-    profesores = repo.get_profesores()
+    return Response(content=_profesores_json(repo), media_type="application/json")
+
+
+@router.get(".ndjson")
+async def listar_profesores_ndjson(
+    repo: IEvaluacionRepository = Depends(get_evaluacion_repository),
+) -> StreamingResponse:
+    """
+    Lista todos los profesores evaluados en formato NDJSON
+    Emite un objeto JSON por línea a medida que se recorre el repositorio,
+    sin construir el listado completo en memoria
     
-    return [
-        ProfesorListItem(
-            documento=p.documento,
-            nombre_completo=p.nombre_completo,
-            total_evaluaciones=p.total_evaluaciones(),
-        )
-        for p in profesores
-    ]
+    Returns:
+        Un profesor por línea con su información básica
+    """
+    async def generar_lineas() -> AsyncIterator[bytes]:
+        for profesor in repo.iter_profesores():
+            yield orjson.dumps({
+                "documento": profesor.documento,
+                "nombre_completo": profesor.nombre_completo,
+                "total_evaluaciones": profesor.total_evaluaciones(),
+            }) + b"\n"
+    
+    return StreamingResponse(generar_lineas(), media_type="application/x-ndjson")
 
 
 @router.get("/{documento}/promedios", response_model=PromedioProfesorResponse)
-async def obtener_promedios_profesor(
+def obtener_promedios_profesor(
     documento: str,
     periodo: Optional[str] = Query(
         None, 
         description="Período específico (ej: 2025-2). Si no se especifica, usa todos."
     ),
     use_case = Depends(get_calcular_promedio_profesor_use_case),
-) -> PromedioProfesorResponse:
+    cache_headers: dict[str, str] = Depends(get_cache_headers),
+) -> ORJSONResponse:
     """
     Obtiene los promedios de un profesor
     
@@ -70,6 +149,7 @@ async def obtener_promedios_profesor(
         Promedios generales, por categoría y por actor
         
     Raises:
+        304: Si el cliente ya tiene la versión vigente (If-None-Match)
         404: Si el profesor no se encuentra o no tiene evaluaciones
     """
     try:
@@ -80,31 +160,9 @@ async def obtener_promedios_profesor(
         
         result = use_case.execute(request)
         
-        # Convertir DTO a Schema (Pydantic)
-        return PromedioProfesorResponse(
-            documento=result.documento,
-            nombre_completo=result.nombre_completo,
-            periodo=result.periodo,
-            promedio_general=result.promedio_general,
-            total_evaluaciones=result.total_evaluaciones,
-            promedios_por_categoria=[
-                {
-                    "categoria": cat.categoria,
-                    "categoria_corta": cat.categoria_corta,
-                    "promedio": cat.promedio,
-                    "total_evaluaciones": cat.total_evaluaciones,
-                }
-                for cat in result.promedios_por_categoria
-            ],
-            promedios_por_actor=[
-                {
-                    "actor": act.actor,
-                    "promedio": act.promedio,
-                    "total_evaluaciones": act.total_evaluaciones,
-                }
-                for act in result.promedios_por_actor
-            ],
-        )
+        # El DTO ya tiene la forma del schema: se serializa directamente
+        # sin reconstruir ni revalidar los modelos Pydantic
+        return ORJSONResponse(result, headers=cache_headers)
         
     except ProfesorNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -113,14 +171,15 @@ async def obtener_promedios_profesor(
 
 
 @router.get("/{documento}/detalle", response_model=DetalleEvaluacionResponse)
-async def obtener_detalle_evaluaciones(
+def obtener_detalle_evaluaciones(
     documento: str,
     periodo: Optional[str] = Query(
         None, 
         description="Período específico (ej: 2025-2). Si no se especifica, usa todos."
     ),
     use_case = Depends(get_detalle_evaluacion_use_case),
-) -> DetalleEvaluacionResponse:
+    cache_headers: dict[str, str] = Depends(get_cache_headers),
+) -> ORJSONResponse:
     """
     Obtiene el detalle de todas las respuestas por pregunta de un profesor
     
@@ -132,6 +191,7 @@ async def obtener_detalle_evaluaciones(
         Detalle de todas las respuestas agrupadas por pregunta
         
     Raises:
+        304: Si el cliente ya tiene la versión vigente (If-None-Match)
         404: Si el profesor no se encuentra o no tiene evaluaciones
     """
     try:
@@ -142,25 +202,9 @@ async def obtener_detalle_evaluaciones(
         
         result = use_case.execute(request)
         
-        # Convertir DTO a Schema (Pydantic)
-        from app.api.models.detalle_schemas import RespuestaPreguntaSchema
-        
-        return DetalleEvaluacionResponse(
-            documento=result.documento,
-            nombre_completo=result.nombre_completo,
-            periodo=result.periodo,
-            total_evaluaciones=result.total_evaluaciones,
-            respuestas=[
-                RespuestaPreguntaSchema(
-                    codigo_pregunta=resp.codigo_pregunta,
-                    texto_pregunta=resp.texto_pregunta,
-                    categoria=resp.categoria,
-                    calificacion=resp.calificacion,
-                    tipo_formulario=resp.tipo_formulario,
-                )
-                for resp in result.respuestas
-            ],
-        )
+        # El DTO ya tiene la forma del schema: se serializa directamente
+        # sin reconstruir ni revalidar los modelos Pydantic
+        return ORJSONResponse(result, headers=cache_headers)
         
     except ProfesorNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -169,14 +213,15 @@ async def obtener_detalle_evaluaciones(
 
 
 @router.get("/{documento}/mejoras", response_model=PropuestaMejoraResponse)
-async def obtener_propuesta_mejora(
+def obtener_propuesta_mejora(
     documento: str,
     periodo: Optional[str] = Query(
         None, 
         description="Período específico (ej: 2025-2). Si no se especifica, usa todos."
     ),
     use_case = Depends(get_propuesta_mejora_use_case),
-) -> PropuestaMejoraResponse:
+    cache_headers: dict[str, str] = Depends(get_cache_headers),
+) -> ORJSONResponse:
     """
     Obtiene propuestas de mejora para categorías con promedio < 4
     
@@ -188,6 +233,7 @@ async def obtener_propuesta_mejora(
         Propuestas de mejora con recomendaciones específicas
         
     Raises:
+        304: Si el cliente ya tiene la versión vigente (If-None-Match)
         404: Si el profesor no se encuentra o no tiene evaluaciones
     """
     try:
@@ -198,33 +244,9 @@ async def obtener_propuesta_mejora(
         
         result = use_case.execute(request)
         
-        # Convertir DTO a Schema (Pydantic)
-        from app.api.models.mejora_schemas import (
-            RecomendacionMejoraSchema,
-            MejoraPorCategoriaSchema,
-        )
-        
-        return PropuestaMejoraResponse(
-            documento=result.documento,
-            nombre_completo=result.nombre_completo,
-            periodo=result.periodo,
-            categorias_a_mejorar=[
-                MejoraPorCategoriaSchema(
-                    categoria=cat.categoria,
-                    promedio_categoria=cat.promedio_categoria,
-                    recomendaciones=[
-                        RecomendacionMejoraSchema(
-                            codigo_pregunta=rec.codigo_pregunta,
-                            texto_pregunta=rec.texto_pregunta,
-                            calificacion_promedio=rec.calificacion_promedio,
-                            recomendacion=rec.recomendacion,
-                        )
-                        for rec in cat.recomendaciones
-                    ],
-                )
-                for cat in result.categorias_a_mejorar
-            ],
-        )
+        # El DTO ya tiene la forma del schema: se serializa directamente
+        # sin reconstruir ni revalidar los modelos Pydantic
+        return ORJSONResponse(result, headers=cache_headers)
         
     except ProfesorNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -239,11 +261,18 @@ async def exportar_pdf(
         None, 
         description="Período específico (ej: 2025-2). Si no se especifica, usa todos."
     ),
-    promedio_use_case = Depends(get_calcular_promedio_profesor_use_case),
-    mejora_use_case = Depends(get_propuesta_mejora_use_case),
-) -> StreamingResponse:
+    reporte_use_case: ReporteProfesorUseCase = Depends(get_reporte_profesor_use_case),
+    pdf_executor: Executor = Depends(get_pdf_executor),
+    pdf_cache: Optional[TTLCache[bytes]] = Depends(get_pdf_cache),
+    data_version: str = Depends(get_data_version),
+) -> Response:
     """
     Exporta el reporte completo del profesor a PDF
+    Los promedios se calculan en un hilo y el PDF se renderiza en el pool de
+    procesos de la aplicación, sin ocupar el event loop ni competir por el
+    GIL; con la cache habilitada, un mismo
+    (documento, período) sobre la misma versión de los datos se renderiza
+    una sola vez
     
     Args:
         documento: Documento del profesor
@@ -255,29 +284,110 @@ async def exportar_pdf(
     Raises:
         404: Si el profesor no se encuentra
     """
+    # ReportLab se importa al pedir el primer PDF, no al arrancar la API
+    from app.infrastructure.services.pdf_generator import PDFGenerator
+    
     try:
-        # Obtener datos del profesor
-        promedio_request = PromedioProfesorRequest(
-            documento=documento,
-            periodo=periodo,
+        clave = (data_version, documento, periodo)
+        contenido = pdf_cache.get(clave) if pdf_cache is not None else None
+        
+        if contenido is None:
+            # Obtener promedios y propuestas de mejora en una sola consulta,
+            # en un hilo para no bloquear el event loop con la agregación
+            reporte = await asyncio.to_thread(
+                reporte_use_case.execute,
+                ReporteProfesorRequest(documento=documento, periodo=periodo),
+            )
+            
+            # Generar PDF en un proceso del pool
+            contenido = await asyncio.get_running_loop().run_in_executor(
+                pdf_executor,
+                PDFGenerator.render_profesor_report,
+                reporte.promedios,
+                reporte.mejoras,
+            )
+            if pdf_cache is not None:
+                pdf_cache.put(clave, contenido)
+        
+        # Nombre del archivo
+        filename = f"reporte_{documento}_{periodo or 'todos'}.pdf".replace(" ", "_")
+        
+        return Response(
+            content=contenido,
+            media_type="application/pdf",
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
-        promedios = promedio_use_case.execute(promedio_request)
         
-        # Obtener propuestas de mejora
-        mejora_request = PropuestaMejoraRequest(
-            documento=documento,
-            periodo=periodo,
+    except ProfesorNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generando PDF: {str(e)}")
+
+
+@router.get("/export-pdf-lote")
+async def exportar_pdf_lote(
+    documentos: list[str] = Query(
+        [],
+        description="Documentos de los profesores a incluir, en orden (ej: ?documentos=1&documentos=2)"
+    ),
+    periodo: Optional[str] = Query(
+        None, 
+        description="Período específico (ej: 2025-2). Si no se especifica, usa todos."
+    ),
+    reporte_use_case: ReporteProfesorUseCase = Depends(get_reporte_profesor_use_case),
+    pdf_executor: Executor = Depends(get_pdf_executor),
+    settings: Settings = Depends(get_settings),
+) -> Response:
+    """
+    Exporta en un único PDF los reportes de varios profesores
+    Cada profesor empieza en una página nueva; los promedios se calculan en
+    un hilo y el documento se construye una sola vez en el pool de procesos
+    
+    Args:
+        documentos: Documentos de los profesores
+        periodo: Período opcional para filtrar
+        
+    Returns:
+        PDF con los reportes de todos los profesores solicitados
+        
+    Raises:
+        404: Si alguno de los profesores no se encuentra
+        422: Si no se indica ningún documento o se superan los permitidos
+    """
+    # Un reporte por documento, sin repetir y en el orden solicitado
+    documentos = list(dict.fromkeys(documentos))
+    if not documentos:
+        raise HTTPException(status_code=422, detail="Debe indicar al menos un documento")
+    if len(documentos) > settings.pdf_lote_max_documentos:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Se permiten hasta {settings.pdf_lote_max_documentos} documentos por lote",
         )
-        mejoras = mejora_use_case.execute(mejora_request)
+    
+    from app.infrastructure.services.pdf_generator import PDFGenerator
+    
+    def calcular_reportes() -> list[ReporteProfesorResponse]:
+        """Promedios y propuestas de mejora de cada documento, en orden"""
+        return [
+            reporte_use_case.execute(
+                ReporteProfesorRequest(documento=documento, periodo=periodo)
+            )
+            for documento in documentos
+        ]
+    
+    try:
+        reportes = await asyncio.to_thread(calcular_reportes)
+        items = [(reporte.promedios, reporte.mejoras) for reporte in reportes]
         
-        # Generar PDF
-        pdf_file = PDFGenerator.generate_profesor_report(promedios, mejoras)
+        contenido = await asyncio.get_running_loop().run_in_executor(
+            pdf_executor, PDFGenerator.render_batch_report, items
+        )
         
-        # Nombre del archivo
-        filename = f"reporte_{documento}_{periodo or 'todos'}.pdf".replace(" ", "_")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"reportes_profesores_{periodo or 'todos'}_{timestamp}.pdf"
         
-        return StreamingResponse(
-            pdf_file,
+        return Response(
+            content=contenido,
             media_type="application/pdf",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -294,12 +404,17 @@ async def exportar_todos_pdfs(
         None, 
         description="Período específico (ej: 2025-2). Si no se especifica, usa todos."
     ),
-    repo = Depends(get_evaluacion_repository),
-    promedio_use_case = Depends(get_calcular_promedio_profesor_use_case),
-    mejora_use_case = Depends(get_propuesta_mejora_use_case),
+    repo: IEvaluacionRepository = Depends(get_evaluacion_repository),
+    reporte_use_case: ReporteProfesorUseCase = Depends(get_reporte_profesor_use_case),
+    pdf_executor: Executor = Depends(get_pdf_executor),
+    settings: Settings = Depends(get_settings),
 ) -> StreamingResponse:
     """
     Exporta reportes PDF de todos los profesores en un archivo ZIP
+    Los PDFs se renderizan en paralelo en el pool de procesos de la aplicación
+    y el ZIP se transmite a medida que cada PDF está listo. Solo hay una
+    ventana acotada de PDFs en curso, así que la memoria no crece con la
+    cantidad de profesores
     
     Args:
         periodo: Período opcional para filtrar
@@ -307,6 +422,8 @@ async def exportar_todos_pdfs(
     Returns:
         ZIP con PDFs de todos los profesores
     """
+    from app.infrastructure.services.pdf_generator import PDFGenerator
+    
     try:
         # Obtener lista de profesores
         profesores = repo.get_profesores()
@@ -314,48 +431,70 @@ async def exportar_todos_pdfs(
         if not profesores:
             raise HTTPException(status_code=404, detail="No hay profesores para exportar")
         
-        # Crear archivo ZIP en memoria
-        zip_buffer = io.BytesIO()
-        
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for profesor in profesores:
-                try:
-                    # Obtener datos del profesor
-                    promedio_request = PromedioProfesorRequest(
-                        documento=profesor.documento,
-                        periodo=periodo,
-                    )
-                    promedios = promedio_use_case.execute(promedio_request)
-                    
-                    # Obtener propuestas de mejora
-                    mejora_request = PropuestaMejoraRequest(
-                        documento=profesor.documento,
-                        periodo=periodo,
-                    )
-                    mejoras = mejora_use_case.execute(mejora_request)
-                    
-                    # Generar PDF
-                    pdf_file = PDFGenerator.generate_profesor_report(promedios, mejoras)
-                    pdf_content = pdf_file.getvalue()
-                    
-                    # Nombre del archivo dentro del ZIP
-                    filename = f"{profesor.documento}_{profesor.nombre_completo.replace(' ', '_')}.pdf"
-                    
-                    # Agregar al ZIP
-                    zip_file.writestr(filename, pdf_content)
-                    
-                except Exception as e:
-                    # Log error pero continuar con otros profesores
-                    print(f"Error generando PDF para {profesor.documento}: {str(e)}")
-                    continue
+        # PDFs en curso a la vez: suficientes para mantener ocupado el pool
+        ventana = (settings.pdf_workers or os.cpu_count() or 1) * 2
+        
+        async def renderizar(documento: str) -> bytes:
+            """Calcula el reporte en un hilo y lo renderiza en el pool"""
+            reporte = await asyncio.to_thread(
+                reporte_use_case.execute,
+                ReporteProfesorRequest(documento=documento, periodo=periodo),
+            )
+            return await asyncio.get_running_loop().run_in_executor(
+                pdf_executor,
+                PDFGenerator.render_profesor_report,
+                reporte.promedios,
+                reporte.mejoras,
+            )
+        
+        async def generar_zip() -> AsyncIterator[bytes]:
+            """
+            Escribe cada PDF en el ZIP en el orden de los profesores y emite
+            los bytes; las tareas se crean aquí, a medida que se libera la
+            ventana, de modo que nada se renderiza si el cliente no lee
+            """
+            buffer = _ZipStreamBuffer()
+            restantes = iter(profesores)
+            en_curso: deque[tuple[str, str, asyncio.Task[bytes]]] = deque()
+            try:
+                # zipfile solo escribe y consulta tell(): no necesita un IO[bytes] completo
+                with zipfile.ZipFile(cast(IO[bytes], buffer), 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                    while True:
+                        for profesor in islice(restantes, ventana - len(en_curso)):
+                            # Nombre del archivo dentro del ZIP
+                            filename = f"{profesor.documento}_{profesor.nombre_completo.replace(' ', '_')}.pdf"
+                            en_curso.append((
+                                profesor.documento,
+                                filename,
+                                asyncio.create_task(renderizar(profesor.documento)),
+                            ))
+                        if not en_curso:
+                            break
+                        
+                        documento, filename, tarea = en_curso.popleft()
+                        try:
+                            pdf_content = await tarea
+                        except Exception as e:
+                            # Log error pero continuar con otros profesores
+                            logger.warning("Error generando PDF para %s: %s", documento, e)
+                            continue
+                        
+                        # Agregar al ZIP y enviar lo escrito hasta ahora
+                        zip_file.writestr(filename, pdf_content)
+                        yield buffer.drain()
+                # Directorio central del ZIP
+                yield buffer.drain()
+            finally:
+                # Si el cliente se desconecta, no seguir renderizando
+                for _, _, tarea in en_curso:
+                    tarea.cancel()
         
         # Preparar respuesta
-        zip_buffer.seek(0)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"reportes_profesores_{periodo or 'todos'}_{timestamp}.zip"
         
         return StreamingResponse(
-            zip_buffer,
+            generar_zip(),
             media_type="application/zip",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -5,7 +5,9 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+# Sin frozen: se crea una por pregunta y evaluación, y el __init__ de una
+# dataclass frozen asigna cada campo con object.__setattr__
+@dataclass(slots=True)
 class RespuestaPreguntaDTO:
     """Respuesta de una pregunta en una evaluación"""
     codigo_pregunta: str
@@ -15,14 +17,14 @@ class RespuestaPreguntaDTO:
     tipo_formulario: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DetalleEvaluacionRequest:
     """Request para obtener detalle de evaluaciones"""
     documento: str
     periodo: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DetalleEvaluacionResponse:
     """Response con detalle de evaluaciones por pregunta"""
     documento: str
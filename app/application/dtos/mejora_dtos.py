@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RecomendacionMejora:
     """Recomendación de mejora para una pregunta específica"""
     codigo_pregunta: str
@@ -14,7 +14,7 @@ class RecomendacionMejora:
     recomendacion: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MejoraPorCategoria:
     """Propuesta de mejora para una categoría"""
     categoria: str
@@ -22,14 +22,14 @@ class MejoraPorCategoria:
     recomendaciones: list[RecomendacionMejora]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PropuestaMejoraRequest:
     """Request para obtener propuesta de mejora"""
     documento: str
     periodo: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PropuestaMejoraResponse:
     """Response con propuestas de mejora"""
     documento: str
@@ -7,14 +7,14 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PromedioProfesorRequest:
     """Request DTO para calcular promedio de profesor"""
     documento: str
     periodo: Optional[str] = None  # Opcional - si no se pasa, usa todos los períodos
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PromedioCategoriaDTO:
     """DTO para promedio de una categoría"""
     categoria: str
@@ -23,7 +23,7 @@ class PromedioCategoriaDTO:
     total_evaluaciones: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PromedioActorDTO:
     """DTO para promedio por tipo de actor evaluador"""
     actor: str
@@ -31,7 +31,7 @@ class PromedioActorDTO:
     total_evaluaciones: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PromedioProfesorResponse:
     """Response DTO con todos los promedios del profesor"""
     documento: str
@@ -43,14 +43,14 @@ class PromedioProfesorResponse:
     promedios_por_actor: list[PromedioActorDTO]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EstadisticasCategoriaRequest:
     """Request para estadísticas de categoría"""
     categoria: str
     periodo: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EstadisticasCategoriaResponse:
     """Response con estadísticas de una categoría"""
     categoria: str
@@ -63,14 +63,14 @@ class EstadisticasCategoriaResponse:
     total_profesores: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComparacionActoresRequest:
     """Request para comparar actores evaluadores"""
     documento: str
     periodo: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComparacionActoresResponse:
     """Response comparando autoevaluación vs otros actores"""
     documento: str
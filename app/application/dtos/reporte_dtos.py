@@ -0,0 +1,22 @@
+"""
+DTOs para el reporte completo de un profesor
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from app.application.dtos.profesor_dtos import PromedioProfesorResponse
+from app.application.dtos.mejora_dtos import PropuestaMejoraResponse
+
+
+@dataclass(slots=True, frozen=True)
+class ReporteProfesorRequest:
+    """Request para generar el reporte de un profesor"""
+    documento: str
+    periodo: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class ReporteProfesorResponse:
+    """Response con promedios y propuestas de mejora del profesor"""
+    promedios: PromedioProfesorResponse
+    mejoras: PropuestaMejoraResponse
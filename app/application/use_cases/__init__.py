@@ -2,9 +2,11 @@
 from .calcular_promedio_profesor import CalcularPromedioProfesorUseCase
 from .obtener_detalle_evaluacion import ObtenerDetalleEvaluacionUseCase
 from .obtener_propuesta_mejora import ObtenerPropuestaMejoraUseCase
+from .generar_reporte_profesor import ReporteProfesorUseCase
 
 __all__ = [
     "CalcularPromedioProfesorUseCase",
     "ObtenerDetalleEvaluacionUseCase",
     "ObtenerPropuestaMejoraUseCase",
+    "ReporteProfesorUseCase",
 ]
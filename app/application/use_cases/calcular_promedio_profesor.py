@@ -2,12 +2,15 @@
 Use Case: Calcular Promedio de Profesor
 Aplicando Single Responsibility y Dependency Inversion
 """
-from statistics import mean
 from collections import defaultdict
+from collections.abc import Sequence
 from typing import Optional
 
+import numpy as np
+
 from app.domain.repositories.i_repository import IEvaluacionRepository
 from app.domain.entities.categoria import Categoria
+from app.domain.entities.evaluacion import CATEGORIAS_CALIFICABLES, Evaluacion
 from app.domain.value_objects.periodo import Periodo
 from app.core.exceptions import ProfesorNotFoundError
 from app.application.dtos.profesor_dtos import (
@@ -28,6 +31,8 @@ class CalcularPromedioProfesorUseCase:
     
     def __init__(self, evaluacion_repository: IEvaluacionRepository):
         self._repository = evaluacion_repository
+        # Respuestas precalculadas por (documento, período o None)
+        self._precalculados: dict[tuple[str, Optional[str]], PromedioProfesorResponse] = {}
     
     def execute(self, request: PromedioProfesorRequest) -> PromedioProfesorResponse:
         """
@@ -42,105 +47,186 @@ class CalcularPromedioProfesorUseCase:
         Raises:
             ProfesorNotFoundError: Si el profesor no tiene evaluaciones
         """
-        # 1. Obtener evaluaciones del profesor
-        evaluaciones = self._repository.find_by_profesor(request.documento)
+        # 1. Usar el resultado precalculado si existe
+        precalculado = self._precalculados.get((request.documento, request.periodo))
+        if precalculado is not None:
+            return precalculado
         
-        if not evaluaciones:
-            raise ProfesorNotFoundError(request.documento)
+        # 2. Obtener evaluaciones del profesor (filtradas por período)
+        evaluaciones = self.obtener_evaluaciones(request.documento, request.periodo)
+        
+        # 3. Calcular promedios
+        return self.construir_respuesta(request.documento, request.periodo, evaluaciones)
+    
+    def precalcular(self) -> int:
+        """
+        Calcula de antemano los promedios de cada profesor, en total y por período
+        Los datos no cambian durante la vida del proceso, así que execute()
+        responde luego con una búsqueda en diccionario
         
-        # 2. Filtrar por período si se especificó
-        if request.periodo:
-            periodo_obj = Periodo(request.periodo)
-            evaluaciones = [e for e in evaluaciones if e.periodo == periodo_obj]
+        Returns:
+            Cantidad de combinaciones (documento, período) precalculadas
+        """
+        precalculados: dict[tuple[str, Optional[str]], PromedioProfesorResponse] = {}
+        
+        for profesor in self._repository.get_profesores():
+            evaluaciones = self._repository.find_by_profesor(profesor.documento)
+            if not evaluaciones:
+                continue
+            
+            precalculados[(profesor.documento, None)] = self.construir_respuesta(
+                profesor.documento, None, evaluaciones
+            )
+            
+            # Agrupar por período en una sola pasada
+            por_periodo: dict[str, list] = defaultdict(list)
+            for evaluacion in evaluaciones:
+                por_periodo[evaluacion.periodo.valor].append(evaluacion)
+            
+            for periodo, evaluaciones_periodo in por_periodo.items():
+                precalculados[(profesor.documento, periodo)] = self.construir_respuesta(
+                    profesor.documento, periodo, evaluaciones_periodo
+                )
+        
+        self._precalculados = precalculados
+        return len(precalculados)
+    
+    def obtener_evaluaciones(
+        self, documento: str, periodo: Optional[str]
+    ) -> Sequence[Evaluacion]:
+        """
+        Obtiene las evaluaciones del profesor, filtradas por período si se especifica
+        
+        Raises:
+            ProfesorNotFoundError: Si el profesor no tiene evaluaciones (un
+                período con formato inválido no tiene evaluaciones)
+        """
+        # Filtrar por período con el índice (documento, período) del repositorio
+        if periodo:
+            evaluaciones = (
+                self._repository.find_by_profesor_and_periodo(
+                    documento, Periodo.from_string(periodo)
+                )
+                if Periodo.es_valido(periodo)
+                else ()
+            )
             
             if not evaluaciones:
+                if not self._repository.find_by_profesor(documento):
+                    raise ProfesorNotFoundError(documento)
                 raise ProfesorNotFoundError(
-                    f"{request.documento} en período {request.periodo}"
+                    f"{documento} en período {periodo}"
                 )
+            
+            return evaluaciones
+        
+        evaluaciones = self._repository.find_by_profesor(documento)
+        
+        if not evaluaciones:
+            raise ProfesorNotFoundError(documento)
+        
+        return evaluaciones
+    
+    def construir_respuesta(
+        self,
+        documento: str,
+        periodo: Optional[str],
+        evaluaciones: Sequence[Evaluacion],
+    ) -> PromedioProfesorResponse:
+        """Calcula todos los promedios a partir de evaluaciones ya filtradas"""
+        # 1. Matrices evaluación × categoría de sumas y cantidades
+        por_evaluacion = [e.sumas_por_categoria() for e in evaluaciones]
+        sumas = np.stack([suma for suma, _ in por_evaluacion])
+        cantidades = np.stack([cantidad for _, cantidad in por_evaluacion])
+        
+        # 2. Promedio de cada evaluación, una sola vez para general y por actor
+        suma_evaluacion = sumas[:, CATEGORIAS_CALIFICABLES].sum(axis=1)
+        cantidad_evaluacion = cantidades[:, CATEGORIAS_CALIFICABLES].sum(axis=1)
+        promedios = np.divide(
+            suma_evaluacion,
+            cantidad_evaluacion,
+            out=np.zeros(len(evaluaciones)),
+            where=cantidad_evaluacion > 0,
+        )
         
         # 3. Calcular promedio general
-        promedio_general = self._calcular_promedio_general(evaluaciones)
+        promedio_general = self._calcular_promedio_general(promedios)
         
         # 4. Calcular promedios por categoría
-        promedios_categoria = self._calcular_por_categoria(evaluaciones)
+        promedios_categoria = self._calcular_por_categoria(sumas, cantidades)
         
         # 5. Calcular promedios por actor
-        promedios_actor = self._calcular_por_actor(evaluaciones)
+        promedios_actor = self._calcular_por_actor(evaluaciones, promedios)
         
         # 6. Construir response
         return PromedioProfesorResponse(
-            documento=request.documento,
+            documento=documento,
             nombre_completo=evaluaciones[0].profesor_nombre,
-            periodo=request.periodo,
+            periodo=periodo,
             promedio_general=promedio_general,
             total_evaluaciones=len(evaluaciones),
             promedios_por_categoria=promedios_categoria,
             promedios_por_actor=promedios_actor,
         )
     
-    def _calcular_promedio_general(self, evaluaciones: list) -> float:
+    def _calcular_promedio_general(self, promedios: np.ndarray) -> float:
         """Calcula el promedio general de todas las evaluaciones"""
-        promedios = [e.calcular_promedio_general() for e in evaluaciones]
-        return mean(promedios) if promedios else 0.0
+        return float(promedios.mean()) if len(promedios) else 0.0
     
-    def _calcular_por_categoria(self, evaluaciones: list) -> list[PromedioCategoriaDTO]:
+    def _calcular_por_categoria(
+        self,
+        sumas: np.ndarray,
+        cantidades: np.ndarray,
+    ) -> list[PromedioCategoriaDTO]:
         """
         Calcula promedios por categoría
-        Agrupa evaluaciones por categoría y calcula promedio
+        MapReduce sobre las matrices evaluación × categoría: se acumulan suma
+        y cantidad de calificaciones por categoría y el promedio es suma / cantidad
         """
-        # Agrupar por categoría
-        categoria_promedios: dict[Categoria, list[float]] = defaultdict(list)
-        categoria_count: dict[Categoria, int] = defaultdict(int)
-        
-        for evaluacion in evaluaciones:
-            for categoria in evaluacion.categorias_evaluadas():
-                if categoria != Categoria.COMENTARIOS:
-                    promedio = evaluacion.calcular_promedio_por_categoria(categoria)
-                    if promedio > 0:
-                        categoria_promedios[categoria].append(promedio)
-                        categoria_count[categoria] += 1
-        
-        # Calcular promedios finales
-        resultados = []
-        for categoria, promedios in categoria_promedios.items():
-            if promedios:
-                resultados.append(
-                    PromedioCategoriaDTO(
-                        categoria=categoria.value,
-                        categoria_corta=categoria.descripcion_corta(),
-                        promedio=mean(promedios),
-                        total_evaluaciones=categoria_count[categoria],
-                    )
-                )
+        # Reduce: totales por categoría (columnas)
+        suma_categoria = sumas.sum(axis=0)
+        cantidad_categoria = cantidades.sum(axis=0)
+        evaluaciones_categoria = (cantidades > 0).sum(axis=0)
+        
+        resultados = [
+            PromedioCategoriaDTO(
+                categoria=categoria.value,
+                categoria_corta=categoria.descripcion_corta(),
+                promedio=float(suma_categoria[categoria.codigo] / cantidad_categoria[categoria.codigo]),
+                total_evaluaciones=int(evaluaciones_categoria[categoria.codigo]),
+            )
+            for categoria in Categoria.categorias_principales()
+            if cantidad_categoria[categoria.codigo]
+        ]
         
         # Ordenar por nombre de categoría
         return sorted(resultados, key=lambda x: x.categoria)
     
-    def _calcular_por_actor(self, evaluaciones: list) -> list[PromedioActorDTO]:
+    def _calcular_por_actor(
+        self,
+        evaluaciones: Sequence[Evaluacion],
+        promedios: np.ndarray,
+    ) -> list[PromedioActorDTO]:
         """
         Calcula promedios por tipo de actor evaluador
-        Agrupa por tipo_formulario
+        Agrupa por tipo_formulario con np.bincount sobre los códigos de actor
         """
-        actor_promedios: dict[str, list[float]] = defaultdict(list)
-        actor_count: dict[str, int] = defaultdict(int)
-        
-        for evaluacion in evaluaciones:
-            promedio = evaluacion.calcular_promedio_general()
-            if promedio > 0:
-                actor_promedios[evaluacion.tipo_formulario].append(promedio)
-                actor_count[evaluacion.tipo_formulario] += 1
-        
-        # Calcular promedios finales
-        resultados = []
-        for actor, promedios in actor_promedios.items():
-            if promedios:
-                resultados.append(
-                    PromedioActorDTO(
-                        actor=actor,
-                        promedio=mean(promedios),
-                        total_evaluaciones=actor_count[actor],
-                    )
-                )
+        actores, codigos = np.unique(
+            [e.tipo_formulario for e in evaluaciones], return_inverse=True
+        )
+        
+        # Solo evaluaciones con calificaciones
+        validas = promedios > 0
+        sumas = np.bincount(codigos[validas], weights=promedios[validas], minlength=len(actores))
+        conteos = np.bincount(codigos[validas], minlength=len(actores))
         
-        # Ordenar por tipo de actor
-        return sorted(resultados, key=lambda x: x.actor)
+        # np.unique retorna los actores ordenados
+        return [
+            PromedioActorDTO(
+                actor=str(actor),
+                promedio=float(sumas[codigo] / conteos[codigo]),
+                total_evaluaciones=int(conteos[codigo]),
+            )
+            for codigo, actor in enumerate(actores)
+            if conteos[codigo]
+        ]
@@ -0,0 +1,64 @@
+"""
+Use Case: Generar Reporte de Profesor
+Calcula promedios y propuestas de mejora sobre un único filtrado de evaluaciones
+"""
+from app.domain.repositories.i_repository import (
+    IEvaluacionRepository,
+    IPreguntaRepository,
+)
+from app.application.dtos.reporte_dtos import (
+    ReporteProfesorRequest,
+    ReporteProfesorResponse,
+)
+from app.application.use_cases.calcular_promedio_profesor import (
+    CalcularPromedioProfesorUseCase,
+)
+from app.application.use_cases.obtener_propuesta_mejora import (
+    ObtenerPropuestaMejoraUseCase,
+)
+
+
+class ReporteProfesorUseCase:
+    """
+    Caso de uso: Reporte completo de un profesor
+    Reutiliza los cálculos de promedios y mejoras sin buscar ni filtrar
+    las evaluaciones dos veces
+    """
+
+    def __init__(
+        self,
+        evaluacion_repository: IEvaluacionRepository,
+        pregunta_repository: IPreguntaRepository,
+    ):
+        self._promedio_use_case = CalcularPromedioProfesorUseCase(evaluacion_repository)
+        self._mejora_use_case = ObtenerPropuestaMejoraUseCase(
+            evaluacion_repository, pregunta_repository
+        )
+
+    def execute(self, request: ReporteProfesorRequest) -> ReporteProfesorResponse:
+        """
+        Genera el reporte del profesor
+        
+        Args:
+            request: Solicitud con documento del profesor y periodo opcional
+            
+        Returns:
+            ReporteProfesorResponse con promedios y propuestas de mejora
+            
+        Raises:
+            ProfesorNotFoundError: Si no se encuentra el profesor
+        """
+        # 1. Obtener evaluaciones una sola vez
+        evaluaciones = self._promedio_use_case.obtener_evaluaciones(
+            request.documento, request.periodo
+        )
+
+        # 2. Calcular ambas agregaciones sobre la misma vista
+        return ReporteProfesorResponse(
+            promedios=self._promedio_use_case.construir_respuesta(
+                request.documento, request.periodo, evaluaciones
+            ),
+            mejoras=self._mejora_use_case.construir_respuesta(
+                request.documento, request.periodo, evaluaciones
+            ),
+        )
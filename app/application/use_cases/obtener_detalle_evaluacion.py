@@ -12,6 +12,8 @@ from app.domain.repositories.i_repository import (
     IEvaluacionRepository,
     IPreguntaRepository,
 )
+from app.domain.value_objects.periodo import Periodo
+from app.core.cache import TTLCache
 from app.core.exceptions import ProfesorNotFoundError
 
 
@@ -24,9 +26,12 @@ class ObtenerDetalleEvaluacionUseCase:
         self,
         evaluacion_repository: IEvaluacionRepository,
         pregunta_repository: IPreguntaRepository,
+        cache: Optional[TTLCache[DetalleEvaluacionResponse]] = None,
     ):
         self._evaluacion_repo = evaluacion_repository
         self._pregunta_repo = pregunta_repository
+        # Respuestas ya calculadas por (documento, período)
+        self._cache = cache
 
     def execute(self, request: DetalleEvaluacionRequest) -> DetalleEvaluacionResponse:
         """
@@ -41,42 +46,52 @@ class ObtenerDetalleEvaluacionUseCase:
         Raises:
             ProfesorNotFoundError: Si no se encuentra el profesor
         """
-        # Buscar evaluaciones del profesor
-        evaluaciones = self._evaluacion_repo.find_by_profesor(request.documento)
-        if not evaluaciones:
-            raise ProfesorNotFoundError(request.documento)
-
-        # Obtener información del profesor de la primera evaluación
-        profesor_nombre = evaluaciones[0].profesor_nombre
+        if self._cache is None:
+            return self._ejecutar(request)
+        return self._cache.get_or_compute(
+            (request.documento, request.periodo),
+            lambda: self._ejecutar(request),
+        )
 
-        # Filtrar evaluaciones por período si se especifica
+    def _ejecutar(self, request: DetalleEvaluacionRequest) -> DetalleEvaluacionResponse:
+        """Calcula la respuesta sin consultar la cache"""
+        # Buscar evaluaciones del profesor; el filtro por período usa el
+        # índice (documento, período) del repositorio
         if request.periodo:
-            evaluaciones = [
-                ev for ev in evaluaciones 
-                if ev.periodo.valor == request.periodo
-            ]
+            evaluaciones = (
+                self._evaluacion_repo.find_by_profesor_and_periodo(
+                    request.documento, Periodo.from_string(request.periodo)
+                )
+                if Periodo.es_valido(request.periodo)
+                else []
+            )
+        else:
+            evaluaciones = self._evaluacion_repo.find_by_profesor(request.documento)
 
         if not evaluaciones:
-            periodo_msg = f" en el período {request.periodo}" if request.periodo else ""
+            if not request.periodo or not self._evaluacion_repo.find_by_profesor(request.documento):
+                raise ProfesorNotFoundError(request.documento)
             raise ProfesorNotFoundError(
-                f"No se encontraron evaluaciones para el profesor {request.documento}{periodo_msg}"
+                f"No se encontraron evaluaciones para el profesor {request.documento} "
+                f"en el período {request.periodo}"
             )
 
-        # Recolectar todas las respuestas de todas las evaluaciones
-        respuestas: list[RespuestaPreguntaDTO] = []
-        
-        for evaluacion in evaluaciones:
-            for pregunta, calificacion in evaluacion.respuestas.items():
-                # La clave del diccionario es el objeto Pregunta, no el código
-                respuestas.append(
-                    RespuestaPreguntaDTO(
-                        codigo_pregunta=pregunta.codigo,
-                        texto_pregunta=pregunta.texto,
-                        categoria=pregunta.categoria.value,
-                        calificacion=calificacion.valor if calificacion else None,
-                        tipo_formulario=evaluacion.tipo_formulario,
-                    )
-                )
+        # Obtener información del profesor de la primera evaluación
+        profesor_nombre = evaluaciones[0].profesor_nombre
+
+        # Recolectar todas las respuestas de todas las evaluaciones en una
+        # sola pasada; la clave del diccionario es el objeto Pregunta
+        respuestas = [
+            RespuestaPreguntaDTO(
+                pregunta.codigo,
+                pregunta.texto,
+                pregunta.categoria.value,
+                calificacion.valor if calificacion else None,
+                evaluacion.tipo_formulario,
+            )
+            for evaluacion in evaluaciones
+            for pregunta, calificacion in evaluacion.respuestas.items()
+        ]
 
         return DetalleEvaluacionResponse(
             documento=request.documento,
@@ -2,8 +2,9 @@
 Use Case: Obtener Propuesta de Mejora
 Genera recomendaciones basadas en categorías con bajo rendimiento
 """
+from collections.abc import Iterable, Sequence
+from functools import cache
 from typing import Optional
-from statistics import mean
 
 from app.application.dtos.mejora_dtos import (
     PropuestaMejoraRequest,
@@ -11,16 +12,21 @@ from app.application.dtos.mejora_dtos import (
     MejoraPorCategoria,
     RecomendacionMejora,
 )
+from app.domain.entities.categoria import Categoria
+from app.domain.entities.evaluacion import Evaluacion
+from app.domain.entities.pregunta import Pregunta
 from app.domain.repositories.i_repository import (
     IEvaluacionRepository,
     IPreguntaRepository,
 )
+from app.domain.value_objects.periodo import Periodo
+from app.core.cache import TTLCache
 from app.core.exceptions import ProfesorNotFoundError
 
 
 # Mapeo de preguntas a recomendaciones de mejora
-RECOMENDACIONES = {
-    "PLANEACIÓN DEL PROCESO ENSEÑANZA - APRENDIZAJE - EVALUACIÓN": {
+RECOMENDACIONES: dict[Categoria, dict] = {
+    Categoria.PLANEACION: {
         "default": "Revise y actualice la planificación de sus clases, asegurándose de incluir objetivos claros, metodologías apropiadas y criterios de evaluación alineados con las competencias del módulo.",
         "keywords": {
             "conocimientos actualizados": "Actualice sus conocimientos mediante capacitaciones, lectura de literatura reciente y participación en comunidades académicas de su disciplina.",
@@ -28,7 +34,7 @@ RECOMENDACIONES = {
             "plan": "Desarrolle un plan de trabajo detallado que sea coherente con el programa y las necesidades de aprendizaje de los estudiantes.",
         }
     },
-    "CONDUCCIÓN DEL PROCESO ENSEÑANZA-APRENDIZAJE": {
+    Categoria.CONDUCCION: {
         "default": "Implemente metodologías activas que promuevan la participación estudiantil, el pensamiento crítico y la aplicación práctica del conocimiento.",
         "keywords": {
             "proyectos de aula": "Diseñe proyectos de aula que conecten la teoría con situaciones reales y promuevan la investigación y creatividad estudiantil.",
@@ -37,7 +43,7 @@ RECOMENDACIONES = {
             "tecnología": "Integre herramientas tecnológicas (aula virtual, aplicaciones, simuladores) de manera efectiva en sus clases.",
         }
     },
-    "EVALUACIÓN DEL APRENDIZAJE": {
+    Categoria.EVALUACION_APRENDIZAJE: {
         "default": "Diseñe evaluaciones variadas que midan de forma integral las competencias desarrolladas, proporcionando retroalimentación oportuna y constructiva.",
         "keywords": {
             "métodos": "Aplique diferentes métodos de evaluación (pruebas escritas, orales, prácticas, proyectos) según las competencias a valorar.",
@@ -46,7 +52,7 @@ RECOMENDACIONES = {
             "criterios": "Defina y comunique claramente los criterios de evaluación antes de cada actividad evaluativa.",
         }
     },
-    "COMPONENTE PERSONAL": {
+    Categoria.COMPONENTE_PERSONAL: {
         "default": "Fortalezca las relaciones interpersonales en el aula mediante el respeto, la empatía y la comunicación efectiva.",
         "keywords": {
             "respeto": "Mantenga una actitud de respeto y tolerancia hacia la diversidad de ideas, creencias y características de los estudiantes.",
@@ -57,6 +63,35 @@ RECOMENDACIONES = {
     },
 }
 
+RECOMENDACION_GENERICA = "Se recomienda revisar y fortalecer las competencias relacionadas con este aspecto mediante capacitación y reflexión sobre su práctica docente."
+
+# Palabras clave en minúsculas por categoría, en orden de prioridad
+_KEYWORDS: dict[Categoria, tuple[tuple[str, str], ...]] = {
+    categoria: tuple(
+        (keyword.lower(), recomendacion)
+        for keyword, recomendacion in config["keywords"].items()
+    )
+    for categoria, config in RECOMENDACIONES.items()
+}
+
+
+@cache
+def _recomendacion_para(categoria: Categoria, texto_lower: str) -> str:
+    """
+    Recomendación para una pregunta según su categoría y texto en minúsculas
+    El catálogo de preguntas es finito: cada pregunta se resuelve una vez
+    """
+    if categoria not in RECOMENDACIONES:
+        return RECOMENDACION_GENERICA
+    
+    # Buscar coincidencias con palabras clave
+    for keyword, recomendacion in _KEYWORDS[categoria]:
+        if keyword in texto_lower:
+            return recomendacion
+    
+    # Si no hay coincidencia, usar recomendación por defecto
+    return RECOMENDACIONES[categoria]["default"]
+
 
 class ObtenerPropuestaMejoraUseCase:
     """
@@ -68,9 +103,12 @@ class ObtenerPropuestaMejoraUseCase:
         self,
         evaluacion_repository: IEvaluacionRepository,
         pregunta_repository: IPreguntaRepository,
+        cache: Optional[TTLCache[PropuestaMejoraResponse]] = None,
     ):
         self._evaluacion_repo = evaluacion_repository
         self._pregunta_repo = pregunta_repository
+        # Respuestas ya calculadas por (documento, período)
+        self._cache = cache
 
     def execute(self, request: PropuestaMejoraRequest) -> PropuestaMejoraResponse:
         """
@@ -85,36 +123,68 @@ class ObtenerPropuestaMejoraUseCase:
         Raises:
             ProfesorNotFoundError: Si no se encuentra el profesor
         """
-        # Buscar evaluaciones del profesor
-        evaluaciones = self._evaluacion_repo.find_by_profesor(request.documento)
-        if not evaluaciones:
-            raise ProfesorNotFoundError(request.documento)
-
-        profesor_nombre = evaluaciones[0].profesor_nombre
+        if self._cache is None:
+            return self._ejecutar(request)
+        return self._cache.get_or_compute(
+            (request.documento, request.periodo),
+            lambda: self._ejecutar(request),
+        )
 
-        # Filtrar por período si se especifica
+    def _ejecutar(self, request: PropuestaMejoraRequest) -> PropuestaMejoraResponse:
+        """Calcula la respuesta sin consultar la cache"""
+        # Buscar evaluaciones del profesor; el filtro por período usa el
+        # índice (documento, período) del repositorio
         if request.periodo:
-            evaluaciones = [
-                ev for ev in evaluaciones 
-                if ev.periodo.valor == request.periodo
-            ]
+            evaluaciones = (
+                self._evaluacion_repo.find_by_profesor_and_periodo(
+                    request.documento, Periodo.from_string(request.periodo)
+                )
+                if Periodo.es_valido(request.periodo)
+                else []
+            )
+        else:
+            evaluaciones = self._evaluacion_repo.find_by_profesor(request.documento)
 
         if not evaluaciones:
+            if not request.periodo or not self._evaluacion_repo.find_by_profesor(request.documento):
+                raise ProfesorNotFoundError(request.documento)
             raise ProfesorNotFoundError(
                 f"No se encontraron evaluaciones para el profesor {request.documento}"
             )
 
-        # Calcular promedios por categoría
-        categorias_promedios = self._calcular_promedios_por_categoria(evaluaciones)
+        profesor_nombre = evaluaciones[0].profesor_nombre
+
+        return self.construir_respuesta(
+            request.documento, request.periodo, evaluaciones, profesor_nombre
+        )
+
+    def construir_respuesta(
+        self,
+        documento: str,
+        periodo: Optional[str],
+        evaluaciones: Sequence[Evaluacion],
+        profesor_nombre: Optional[str] = None,
+    ) -> PropuestaMejoraResponse:
+        """Genera la propuesta de mejora a partir de evaluaciones ya filtradas"""
+        # Suma y cantidad de calificaciones por pregunta, en una sola pasada
+        sumas, cantidades, preguntas = self._acumular_calificaciones(evaluaciones)
+        
+        # Códigos de pregunta por categoría, en orden de aparición
+        codigos_por_categoria: dict[Categoria, list[str]] = {}
+        for codigo, pregunta in preguntas.items():
+            codigos_por_categoria.setdefault(pregunta.categoria, []).append(codigo)
         
         # Identificar categorías con promedio < 4
         categorias_a_mejorar = []
         
-        for categoria, promedio in categorias_promedios.items():
+        for categoria, codigos in codigos_por_categoria.items():
+            promedio = (
+                sum(sumas[c] for c in codigos) / sum(cantidades[c] for c in codigos)
+            )
             if promedio < 4.0:
                 # Obtener preguntas de esta categoría con bajo rendimiento
                 recomendaciones = self._generar_recomendaciones(
-                    categoria, evaluaciones
+                    categoria, codigos, sumas, cantidades, preguntas
                 )
                 
                 if recomendaciones:
@@ -127,57 +197,54 @@ class ObtenerPropuestaMejoraUseCase:
                     )
 
         return PropuestaMejoraResponse(
-            documento=request.documento,
-            nombre_completo=profesor_nombre,
-            periodo=request.periodo,
+            documento=documento,
+            nombre_completo=profesor_nombre or evaluaciones[0].profesor_nombre,
+            periodo=periodo,
             categorias_a_mejorar=categorias_a_mejorar,
         )
 
-    def _calcular_promedios_por_categoria(self, evaluaciones) -> dict:
-        """Calcula el promedio de cada categoría"""
-        from collections import defaultdict
-        
-        categoria_calificaciones = defaultdict(list)
+    def _acumular_calificaciones(
+        self, evaluaciones: Iterable[Evaluacion]
+    ) -> tuple[dict[str, float], dict[str, int], dict[str, Pregunta]]:
+        """
+        Acumula suma y cantidad de calificaciones válidas por código de pregunta
+        Retorna (sumas, cantidades, preguntas por código)
+        """
+        # Clave str por pregunta: hash y comparación nativos, sin pasar por
+        # Pregunta.__hash__/__eq__
+        sumas: dict[str, float] = {}
+        cantidades: dict[str, int] = {}
+        preguntas: dict[str, Pregunta] = {}
         
         for evaluacion in evaluaciones:
             for pregunta, calificacion in evaluacion.respuestas.items():
-                if calificacion and not pregunta.es_comentario():
-                    categoria_calificaciones[pregunta.categoria].append(
-                        calificacion.valor
-                    )
+                if calificacion and not pregunta.comentario:
+                    codigo = pregunta.codigo
+                    sumas[codigo] = sumas.get(codigo, 0.0) + calificacion.valor
+                    cantidades[codigo] = cantidades.get(codigo, 0) + 1
+                    preguntas.setdefault(codigo, pregunta)
         
-        return {
-            cat: mean(cals) 
-            for cat, cals in categoria_calificaciones.items()
-            if cals
-        }
+        return sumas, cantidades, preguntas
 
     def _generar_recomendaciones(
-        self, categoria, evaluaciones
+        self,
+        categoria: Categoria,
+        codigos: list[str],
+        sumas: dict[str, float],
+        cantidades: dict[str, int],
+        preguntas: dict[str, Pregunta],
     ) -> list[RecomendacionMejora]:
         """Genera recomendaciones para una categoría"""
-        from collections import defaultdict
-        
-        # Agrupar calificaciones por pregunta
-        pregunta_calificaciones = defaultdict(list)
-        
-        for evaluacion in evaluaciones:
-            for pregunta, calificacion in evaluacion.respuestas.items():
-                if (pregunta.categoria == categoria and 
-                    calificacion and 
-                    not pregunta.es_comentario()):
-                    pregunta_calificaciones[pregunta].append(calificacion.valor)
-        
         # Generar recomendaciones para preguntas con promedio < 4
         recomendaciones = []
-        categoria_nombre = categoria.value
         
-        for pregunta, calificaciones in pregunta_calificaciones.items():
-            promedio = mean(calificaciones)
+        for codigo in codigos:
+            pregunta = preguntas[codigo]
+            promedio = sumas[codigo] / cantidades[codigo]
             
             if promedio < 4.0:
                 recomendacion_texto = self._obtener_recomendacion(
-                    categoria_nombre, pregunta.texto
+                    categoria, pregunta
                 )
                 
                 recomendaciones.append(
@@ -194,18 +261,6 @@ class ObtenerPropuestaMejoraUseCase:
         
         return recomendaciones
 
-    def _obtener_recomendacion(self, categoria: str, texto_pregunta: str) -> str:
+    def _obtener_recomendacion(self, categoria: Categoria, pregunta: Pregunta) -> str:
         """Obtiene la recomendación apropiada según la categoría y pregunta"""
-        if categoria not in RECOMENDACIONES:
-            return "Se recomienda revisar y fortalecer las competencias relacionadas con este aspecto mediante capacitación y reflexión sobre su práctica docente."
-        
-        config = RECOMENDACIONES[categoria]
-        texto_lower = texto_pregunta.lower()
-        
-        # Buscar coincidencias con palabras clave
-        for keyword, recomendacion in config["keywords"].items():
-            if keyword in texto_lower:
-                return recomendacion
-        
-        # Si no hay coincidencia, usar recomendación por defecto
-        return config["default"]
+        return _recomendacion_para(categoria, pregunta.texto_lower)
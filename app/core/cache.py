@@ -0,0 +1,72 @@
+"""
+Cache en memoria con expiración (TTL)
+Usado por los use cases para no recalcular respuestas idénticas
+"""
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from time import monotonic
+from typing import Generic, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Cache LRU acotado en tamaño cuyas entradas expiran tras ttl segundos
+    Thread-safe: los handlers síncronos se ejecutan en el threadpool
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entradas: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+    
+    def get(self, clave: Hashable) -> Optional[V]:
+        """Retorna el valor vigente para la clave, o None si no está o expiró"""
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None and entrada[0] > monotonic():
+                self._entradas.move_to_end(clave)
+                return entrada[1]
+        return None
+    
+    def put(self, clave: Hashable, valor: V) -> None:
+        """
+        Guarda un valor ya calculado
+        Para cálculos asíncronos, que no encajan en get_or_compute()
+        """
+        self._guardar(clave, valor, monotonic())
+    
+    def get_or_compute(self, clave: Hashable, calcular: Callable[[], V]) -> V:
+        """
+        Retorna el valor vigente para la clave o lo calcula y lo guarda
+        Las excepciones de calcular() se propagan y no se guardan
+        """
+        ahora = monotonic()
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None and entrada[0] > ahora:
+                self._entradas.move_to_end(clave)
+                return entrada[1]
+        
+        valor = calcular()
+        self._guardar(clave, valor, ahora)
+        return valor
+    
+    def _guardar(self, clave: Hashable, valor: V, ahora: float) -> None:
+        """Inserta la entrada y descarta las menos recientes si se excede maxsize"""
+        with self._lock:
+            self._entradas[clave] = (ahora + self._ttl, valor)
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self._maxsize:
+                self._entradas.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Descarta todas las entradas"""
+        with self._lock:
+            self._entradas.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entradas)
@@ -4,6 +4,7 @@ Aplicando Dependency Inversion y Single Responsibility
 """
 from pydantic_settings import BaseSettings
 from pathlib import Path
+from typing import Optional
 from functools import lru_cache
 
 
@@ -12,8 +13,9 @@ class Settings(BaseSettings):
     
     # Application
     app_name: str = "Evaluacion Dashboard API"
-    app_version: str = "0.1.0"
+    app_version: str = "0.1.0"  # Parte del ETag: subirla si cambian las respuestas
     debug: bool = True
+    log_level: str = "INFO"  # Nivel de logging de los módulos app.*
     
     # API
     api_prefix: str = "/api/v1"
@@ -31,9 +33,16 @@ class Settings(BaseSettings):
     preguntas_file: Path = data_dir / "preguntas.csv"
     # evaluaciones_file ya no es necesario - carga todos los Evaluacion*.csv automáticamente
     
+    # PDF
+    pdf_workers: Optional[int] = None  # Procesos para generar PDFs (None = núcleos de CPU)
+    pdf_lote_max_documentos: int = 50  # Profesores por PDF en /export-pdf-lote
+    
     # Cache
     enable_cache: bool = True
+    enable_data_cache: bool = True  # Copias Parquet de los CSV en data_dir/.cache
     cache_ttl: int = 3600  # 1 hour in seconds
+    cache_maxsize: int = 1024  # Respuestas cacheadas por use case
+    pdf_cache_maxsize: int = 128  # PDFs renderizados en memoria
     
     class Config:
         env_file = ".env"
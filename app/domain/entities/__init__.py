@@ -2,6 +2,7 @@
 from .categoria import Categoria
 from .pregunta import Pregunta
 from .profesor import Profesor
+from .tipo_actor import TipoActor
 from .evaluacion import Evaluacion
 
-__all__ = ["Categoria", "Pregunta", "Profesor", "Evaluacion"]
+__all__ = ["Categoria", "Pregunta", "Profesor", "TipoActor", "Evaluacion"]
@@ -40,18 +40,29 @@ class Categoria(str, Enum):
         """Retorna solo las categorías principales (excluye COMENTARIOS)"""
         return [c for c in cls if c != cls.COMENTARIOS]
     
+    @property
+    def codigo(self) -> int:
+        """Código entero estable de la categoría (posición en el enum)"""
+        return _CODIGOS[self]
+    
     def descripcion_corta(self) -> str:
         """Versión corta del nombre para visualizaciones"""
-        mapping = {
-            self.PLANEACION: "Planeación",
-            self.CONDUCCION: "Conducción",
-            self.EVALUACION_APRENDIZAJE: "Eval. Aprendizaje",
-            self.COMPONENTE_PERSONAL: "Personal",
-            self.COMPORTAMIENTO: "Comportamiento",
-            self.ENSENANZA_APRENDIZAJE: "Enseñanza-Aprendizaje",
-            self.EVALUACION: "Evaluación",
-            self.POSGRADO: "Posgrado",
-            self.ESTRUCTURA_AULA_VIRTUAL: "Aula Virtual",
-            self.COMENTARIOS: "Comentarios"
-        }
-        return mapping.get(self, self.value)
+        return _DESCRIPCION_CORTA.get(self, self.value)
+
+
+# Códigos enteros por categoría, para indexar arreglos de agregación
+_CODIGOS: dict[Categoria, int] = {categoria: i for i, categoria in enumerate(Categoria)}
+
+# Versión corta de cada nombre, construida una sola vez
+_DESCRIPCION_CORTA: dict[Categoria, str] = {
+    Categoria.PLANEACION: "Planeación",
+    Categoria.CONDUCCION: "Conducción",
+    Categoria.EVALUACION_APRENDIZAJE: "Eval. Aprendizaje",
+    Categoria.COMPONENTE_PERSONAL: "Personal",
+    Categoria.COMPORTAMIENTO: "Comportamiento",
+    Categoria.ENSENANZA_APRENDIZAJE: "Enseñanza-Aprendizaje",
+    Categoria.EVALUACION: "Evaluación",
+    Categoria.POSGRADO: "Posgrado",
+    Categoria.ESTRUCTURA_AULA_VIRTUAL: "Aula Virtual",
+    Categoria.COMENTARIOS: "Comentarios",
+}
@@ -4,15 +4,21 @@ Representa una evaluación realizada por un actor a un profesor
 """
 from dataclasses import dataclass, field
 from typing import Optional
-from statistics import mean
+
+import numpy as np
 
 from app.domain.value_objects.calificacion import Calificacion
 from app.domain.value_objects.periodo import Periodo
 from app.domain.entities.pregunta import Pregunta
 from app.domain.entities.categoria import Categoria
+from app.domain.entities.tipo_actor import TipoActor
+
 
+# Categorías que cuentan para el promedio general (todas menos comentarios)
+CATEGORIAS_CALIFICABLES = np.array([c != Categoria.COMENTARIOS for c in Categoria])
 
-@dataclass
+
+@dataclass(slots=True)
 class Evaluacion:
     """
     Entity que representa una evaluación
@@ -25,6 +31,21 @@ class Evaluacion:
     periodo: Periodo
     tipo_formulario: str  # AUTOEVALUACIÓN V2, ESTUDIANTE V3, etc.
     respuestas: dict[Pregunta, Optional[Calificacion]] = field(default_factory=dict)
+    # Clasificación del tipo de formulario, derivada en __post_init__
+    tipo_actor: TipoActor = field(default=TipoActor.OTRO, init=False)
+    # Suma y cantidad de calificaciones por categoría, indexadas por
+    # Categoria.codigo; calculadas con freeze() e invalidadas por agregar_respuesta
+    _sumas: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _cantidades: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _categorias: Optional[frozenset[Categoria]] = field(default=None, init=False, repr=False)
+    # Respuestas con calificación agrupadas por categoría
+    _por_categoria: Optional[dict[Categoria, dict[Pregunta, Calificacion]]] = field(
+        default=None, init=False, repr=False
+    )
+    
+    def __post_init__(self) -> None:
+        """Clasifica el tipo de formulario una sola vez"""
+        self.tipo_actor = TipoActor.from_formulario(self.tipo_formulario)
     
     def __eq__(self, other: object) -> bool:
         """Igualdad basada en el ID"""
@@ -39,66 +60,88 @@ class Evaluacion:
     def agregar_respuesta(self, pregunta: Pregunta, calificacion: Optional[Calificacion]) -> None:
         """Agrega una respuesta a la evaluación"""
         self.respuestas[pregunta] = calificacion
+        self._sumas = None
+        self._cantidades = None
+        self._categorias = None
+        self._por_categoria = None
+    
+    def freeze(self) -> None:
+        """
+        Precalcula suma, cantidad y respuestas por categoría, y las categorías evaluadas
+        Se invoca al terminar la carga; si luego se agregan respuestas, los
+        arreglos se recalculan en el siguiente cálculo
+        """
+        sumas = [0.0] * len(Categoria)
+        cantidades = [0] * len(Categoria)
+        por_categoria: dict[Categoria, dict[Pregunta, Calificacion]] = {}
+        for pregunta, cal in self.respuestas.items():
+            if cal is not None:
+                codigo = pregunta.categoria.codigo
+                sumas[codigo] += cal.valor
+                cantidades[codigo] += 1
+                por_categoria.setdefault(pregunta.categoria, {})[pregunta] = cal
+        self._por_categoria = por_categoria
+        self._sumas = np.array(sumas, dtype=np.float64)
+        self._cantidades = np.array(cantidades, dtype=np.int64)
+        self._categorias = frozenset(
+            pregunta.categoria
+            for pregunta in self.respuestas
+            if not pregunta.comentario
+        )
+    
+    def sumas_por_categoria(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna (sumas, cantidades) de calificaciones válidas por categoría
+        Arreglos paralelos indexados por Categoria.codigo
+        """
+        if self._sumas is None:
+            self.freeze()
+        # freeze() deja ambos arreglos calculados
+        assert self._sumas is not None and self._cantidades is not None
+        return self._sumas, self._cantidades
     
     def calcular_promedio_general(self) -> float:
         """
         Calcula el promedio general de todas las respuestas válidas
         Ignora respuestas None y preguntas de comentarios
         """
-        calificaciones = [
-            float(cal) 
-            for pregunta, cal in self.respuestas.items() 
-            if cal is not None and not pregunta.es_comentario()
-        ]
-        
-        if not calificaciones:
-            return 0.0
-        
-        return mean(calificaciones)
+        sumas, cantidades = self.sumas_por_categoria()
+        cantidad = cantidades[CATEGORIAS_CALIFICABLES].sum()
+        return float(sumas[CATEGORIAS_CALIFICABLES].sum() / cantidad) if cantidad else 0.0
     
     def calcular_promedio_por_categoria(self, categoria: Categoria) -> float:
         """Calcula el promedio de una categoría específica"""
-        calificaciones = [
-            float(cal)
-            for pregunta, cal in self.respuestas.items()
-            if cal is not None 
-            and pregunta.pertenece_a_categoria(categoria)
-        ]
-        
-        if not calificaciones:
-            return 0.0
-        
-        return mean(calificaciones)
+        sumas, cantidades = self.sumas_por_categoria()
+        cantidad = cantidades[categoria.codigo]
+        return float(sumas[categoria.codigo] / cantidad) if cantidad else 0.0
     
     def obtener_respuestas_por_categoria(self, categoria: Categoria) -> dict[Pregunta, Calificacion]:
         """Retorna todas las respuestas de una categoría específica"""
-        return {
-            pregunta: cal
-            for pregunta, cal in self.respuestas.items()
-            if cal is not None and pregunta.pertenece_a_categoria(categoria)
-        }
+        if self._por_categoria is None:
+            self.freeze()
+        assert self._por_categoria is not None
+        return self._por_categoria.get(categoria, {}).copy()
     
-    def categorias_evaluadas(self) -> set[Categoria]:
+    def categorias_evaluadas(self) -> frozenset[Categoria]:
         """Retorna el conjunto de categorías que tienen respuestas"""
-        return {
-            pregunta.categoria
-            for pregunta in self.respuestas.keys()
-            if not pregunta.es_comentario()
-        }
+        if self._categorias is None:
+            self.freeze()
+        assert self._categorias is not None
+        return self._categorias
     
     def es_autoevaluacion(self) -> bool:
         """Verifica si es una autoevaluación"""
-        return "AUTOEVALUACIÓN" in self.tipo_formulario.upper()
+        return self.tipo_actor == TipoActor.AUTOEVALUACION
     
     def es_evaluacion_estudiante(self) -> bool:
         """Verifica si es evaluación de estudiante"""
-        return "ESTUDIANTE" in self.tipo_formulario.upper()
+        return self.tipo_actor == TipoActor.ESTUDIANTE
     
     def total_respuestas_validas(self) -> int:
         """Cuenta respuestas válidas (no None, no comentarios)"""
         return sum(
             1 for pregunta, cal in self.respuestas.items()
-            if cal is not None and not pregunta.es_comentario()
+            if cal is not None and not pregunta.comentario
         )
     
     def __str__(self) -> str:
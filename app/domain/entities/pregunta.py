@@ -2,11 +2,11 @@
 Entity: Pregunta
 Representa una pregunta del formulario de evaluación
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from app.domain.entities.categoria import Categoria
 
 
-@dataclass
+@dataclass(slots=True)
 class Pregunta:
     """
     Entity que representa una pregunta de evaluación
@@ -16,6 +16,16 @@ class Pregunta:
     codigo: str
     categoria: Categoria
     texto: str
+    # True si la pregunta es de la categoría COMENTARIOS; se calcula una vez
+    # para leerlo como atributo en los recorridos de respuestas
+    comentario: bool = field(default=False, init=False, repr=False, compare=False)
+    # Texto en minúsculas para buscar palabras clave sin recalcularlo
+    texto_lower: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Precalcula si la pregunta es de comentarios y su texto en minúsculas"""
+        self.comentario = self.categoria == Categoria.COMENTARIOS
+        self.texto_lower = self.texto.lower()
     
     def __eq__(self, other: object) -> bool:
         """Igualdad basada en el código (identidad)"""
@@ -33,7 +43,7 @@ class Pregunta:
     
     def es_comentario(self) -> bool:
         """Verifica si es una pregunta de tipo comentario"""
-        return self.categoria == Categoria.COMENTARIOS
+        return self.comentario
     
     def __str__(self) -> str:
         return f"{self.codigo} - {self.categoria.descripcion_corta()}"
@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from app.domain.entities.evaluacion import Evaluacion
 
 
-@dataclass
+@dataclass(slots=True)
 class Profesor:
     """
     Entity que representa un profesor
@@ -32,7 +32,12 @@ class Profesor:
         return hash(self.documento)
     
     def agregar_evaluacion(self, evaluacion: 'Evaluacion') -> None:
-        """Agrega una evaluación al profesor"""
+        """
+        Agrega una evaluación al profesor, sin duplicar IDs
+        La búsqueda es lineal: la lista es pública y un índice paralelo de
+        IDs quedaría desactualizado si se modifica directamente. La carga de
+        datos no pasa por aquí (el repositorio deduplica al construir)
+        """
         if evaluacion not in self.evaluaciones:
             self.evaluaciones.append(evaluacion)
     
@@ -0,0 +1,32 @@
+"""
+Entity: TipoActor
+Clasifica el tipo de formulario según el actor que evalúa
+"""
+from enum import IntEnum
+from functools import cache
+
+
+class TipoActor(IntEnum):
+    """
+    Tipo de actor de una evaluación
+    Se deriva una vez del tipo de formulario (AUTOEVALUACIÓN V2, ESTUDIANTE V3, etc.)
+    """
+    OTRO = 0
+    AUTOEVALUACION = 1
+    ESTUDIANTE = 2
+    
+    @classmethod
+    def from_formulario(cls, tipo_formulario: str) -> 'TipoActor':
+        """Factory method para clasificar un tipo de formulario"""
+        return _clasificar(tipo_formulario)
+
+
+@cache
+def _clasificar(tipo_formulario: str) -> TipoActor:
+    """Los tipos de formulario distintos son pocos: cada uno se clasifica una vez"""
+    tipo = tipo_formulario.upper()
+    if "AUTOEVALUACIÓN" in tipo:
+        return TipoActor.AUTOEVALUACION
+    if "ESTUDIANTE" in tipo:
+        return TipoActor.ESTUDIANTE
+    return TipoActor.OTRO
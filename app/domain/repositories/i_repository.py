@@ -3,6 +3,7 @@ Repository Interface - Dependency Inversion Principle
 El dominio define el contrato, la infraestructura lo implementa
 """
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
 from typing import Optional
 
 from app.domain.entities.evaluacion import Evaluacion
@@ -23,8 +24,11 @@ class IEvaluacionRepository(ABC):
     """
     
     @abstractmethod
-    def find_all(self) -> list[Evaluacion]:
-        """Obtiene todas las evaluaciones"""
+    def find_all(self) -> Sequence[Evaluacion]:
+        """
+        Obtiene todas las evaluaciones
+        Las secuencias retornadas por los find_* son de solo lectura
+        """
         pass
     
     @abstractmethod
@@ -33,12 +37,12 @@ class IEvaluacionRepository(ABC):
         pass
     
     @abstractmethod
-    def find_by_profesor(self, documento: str) -> list[Evaluacion]:
+    def find_by_profesor(self, documento: str) -> Sequence[Evaluacion]:
         """Obtiene todas las evaluaciones de un profesor"""
         pass
     
     @abstractmethod
-    def find_by_periodo(self, periodo: Periodo) -> list[Evaluacion]:
+    def find_by_periodo(self, periodo: Periodo) -> Sequence[Evaluacion]:
         """Obtiene todas las evaluaciones de un período"""
         pass
     
@@ -47,12 +51,12 @@ class IEvaluacionRepository(ABC):
         self, 
         documento: str, 
         periodo: Periodo
-    ) -> list[Evaluacion]:
+    ) -> Sequence[Evaluacion]:
         """Obtiene evaluaciones de un profesor en un período específico"""
         pass
     
     @abstractmethod
-    def find_by_tipo_formulario(self, tipo: str) -> list[Evaluacion]:
+    def find_by_tipo_formulario(self, tipo: str) -> Sequence[Evaluacion]:
         """Obtiene evaluaciones por tipo de formulario (actor)"""
         pass
     
@@ -61,6 +65,11 @@ class IEvaluacionRepository(ABC):
         """Obtiene lista de todos los profesores evaluados"""
         pass
     
+    @abstractmethod
+    def iter_profesores(self) -> Iterator[Profesor]:
+        """Itera los profesores evaluados uno a uno, sin construir la lista completa"""
+        pass
+    
     @abstractmethod
     def get_periodos_disponibles(self) -> list[Periodo]:
         """Obtiene lista de períodos con evaluaciones"""
@@ -70,6 +79,16 @@ class IEvaluacionRepository(ABC):
     def get_tipos_formulario(self) -> list[str]:
         """Obtiene lista de tipos de formulario (actores)"""
         pass
+    
+    @abstractmethod
+    def count_by_periodo(self) -> dict[Periodo, int]:
+        """Cuenta evaluaciones por período, en orden cronológico"""
+        pass
+    
+    @abstractmethod
+    def count_by_tipo_formulario(self) -> dict[str, int]:
+        """Cuenta evaluaciones por tipo de formulario (actor)"""
+        pass
 
 
 class IPreguntaRepository(ABC):
@@ -3,10 +3,13 @@ Value Object: Calificacion
 Inmutable, self-validating, siguiendo DDD principles
 """
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar
+
 from app.core.exceptions import InvalidCalificacionError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Calificacion:
     """
     Value Object que representa una calificación en escala 1-5
@@ -16,14 +19,22 @@ class Calificacion:
     """
     valor: float
     
-    MIN_VALOR: float = 1.0
-    MAX_VALOR: float = 5.0
+    MIN_VALOR: ClassVar[float] = 1.0
+    MAX_VALOR: ClassVar[float] = 5.0
     
     def __post_init__(self) -> None:
         """Validación de invariantes del negocio"""
         if not self.MIN_VALOR <= self.valor <= self.MAX_VALOR:
             raise InvalidCalificacionError(self.valor)
     
+    @classmethod
+    def from_valor(cls, valor: float) -> 'Calificacion':
+        """
+        Factory method que reutiliza una única instancia por valor
+        Las calificaciones toman pocos valores distintos (escala 1-5)
+        """
+        return _interned(valor)
+    
     def es_aprobatoria(self) -> bool:
         """Calificación >= 3.0 se considera aprobatoria"""
         return self.valor >= 3.0
@@ -51,3 +62,9 @@ class Calificacion:
     
     def __str__(self) -> str:
         return f"{self.valor:.2f}"
+
+
+@lru_cache(maxsize=256)
+def _interned(valor: float) -> Calificacion:
+    """Instancia compartida de Calificacion para cada valor"""
+    return Calificacion(valor)
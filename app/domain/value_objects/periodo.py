@@ -2,8 +2,19 @@
 Value Object: Periodo
 Representa un período académico (ej: 2025-2)
 """
-from dataclasses import dataclass
-import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+
+def _formato_valido(valor: str) -> bool:
+    """Formato YYYY-1 o YYYY-2, comprobado carácter por carácter"""
+    return (
+        len(valor) == 6
+        and valor[:4].isascii()
+        and valor[:4].isdigit()
+        and valor[4] == '-'
+        and valor[5] in '12'
+    )
 
 
 @dataclass(frozen=True)
@@ -13,26 +24,35 @@ class Periodo:
     Formato esperado: YYYY-N (ej: 2025-2)
     """
     valor: str
-    
-    PATTERN = re.compile(r'^\d{4}-[12]$')
+    # Año y semestre, derivados del valor en __post_init__
+    anio: int = field(init=False, repr=False, compare=False)
+    semestre: int = field(init=False, repr=False, compare=False)
+    # Clave (año, semestre) para ordenar cronológicamente
+    _orden: tuple[int, int] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self) -> None:
-        """Valida formato del período"""
-        if not self.PATTERN.match(self.valor):
+        """Valida formato del período y extrae año y semestre"""
+        if not _formato_valido(self.valor):
             raise ValueError(
                 f"Formato de período inválido: {self.valor}. "
                 "Esperado: YYYY-1 o YYYY-2"
             )
+        object.__setattr__(self, "anio", int(self.valor[:4]))
+        object.__setattr__(self, "semestre", int(self.valor[5]))
+        object.__setattr__(self, "_orden", (self.anio, self.semestre))
     
-    @property
-    def anio(self) -> int:
-        """Extrae el año del período"""
-        return int(self.valor.split('-')[0])
+    @classmethod
+    def from_string(cls, valor: str) -> 'Periodo':
+        """
+        Factory method que reutiliza una única instancia por valor
+        Las búsquedas en índices por período comparan primero por identidad
+        """
+        return _interned(valor)
     
-    @property
-    def semestre(self) -> int:
-        """Extrae el semestre (1 o 2)"""
-        return int(self.valor.split('-')[1])
+    @classmethod
+    def es_valido(cls, valor: str) -> bool:
+        """Verifica si un texto tiene el formato de período"""
+        return _formato_valido(valor)
     
     def es_mismo_anio(self, otro: 'Periodo') -> bool:
         """Compara si dos períodos son del mismo año"""
@@ -43,6 +63,10 @@ class Periodo:
     
     def __lt__(self, otro: 'Periodo') -> bool:
         """Permite ordenar períodos cronológicamente"""
-        if self.anio != otro.anio:
-            return self.anio < otro.anio
-        return self.semestre < otro.semestre
+        return self._orden < otro._orden
+
+
+@lru_cache(maxsize=64)
+def _interned(valor: str) -> Periodo:
+    """Instancia compartida de Periodo para cada valor"""
+    return Periodo(valor)
@@ -3,20 +3,127 @@ CSV Parser - Infrastructure Layer
 Convierte archivos CSV en entidades del dominio
 Aplicando Single Responsibility y Factory Pattern
 """
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Optional
+import csv
+from collections.abc import Callable, Iterator
+from typing import Any, Optional, TypeVar
+import hashlib
 import logging
+import sys
 
 from app.domain.entities.pregunta import Pregunta
 from app.domain.entities.evaluacion import Evaluacion
 from app.domain.entities.categoria import Categoria
 from app.domain.value_objects.calificacion import Calificacion
 from app.domain.value_objects.periodo import Periodo
-from app.core.exceptions import DataParsingError
+from app.core.exceptions import DataParsingError, InvalidCalificacionError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Incrementar si cambia el formato de la cache, para invalidar caches previos
+_CACHE_VERSION = 4
+
+# Filas de evaluaciones que se convierten a la vez en EvaluacionCSVParser.parse_iter
+_FILAS_POR_BLOQUE = 100_000
+
+# Columnas de metadatos de cada evaluación
+_COLUMNAS_METADATOS = ("PEGE_ID", "DOCUMENTO", "NOMBRECOMPLETO", "PERIODO", "FORMULARIO")
+
+# Columnas de texto con pocos valores distintos: se leen como category
+_EVALUACION_DTYPES = {
+    "NOMBRECOMPLETO": "category",
+    "PERIODO": "category",
+    "FORMULARIO": "category",
+}
+
+
+def _leer_csv_con_cache(
+    file_path: Path,
+    cache_dir: Optional[Path],
+    **read_kwargs: Any,
+) -> pd.DataFrame:
+    """
+    Lee un CSV usando una copia Parquet en cache_dir cuando está vigente
+    
+    La copia se identifica por nombre, tamaño y mtime del CSV original y por
+    las opciones de lectura: si cambia alguno, se vuelve a parsear el CSV y
+    se regenera el Parquet.
+    """
+    if cache_dir is None:
+        return pd.read_csv(file_path, **read_kwargs)
+    
+    stat = file_path.stat()
+    huella = hashlib.sha1(
+        f"{_CACHE_VERSION}:{file_path.name}:{stat.st_size}:{stat.st_mtime_ns}:"
+        f"{read_kwargs!r}".encode()
+    ).hexdigest()[:16]
+    cache_path = cache_dir / f"{file_path.stem}-{huella}.parquet"
+    
+    if cache_path.exists():
+        try:
+            df = pd.read_parquet(cache_path)
+            logger.info("Usando cache Parquet %s para %s", cache_path.name, file_path.name)
+            return df
+        except Exception as e:
+            logger.warning("Cache Parquet inválido %s: %s", cache_path, e)
+    
+    df = pd.read_csv(file_path, **read_kwargs)
+    
+    # La cache es una optimización: si no se puede escribir, se sigue con el CSV
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for obsoleto in cache_dir.glob(f"{file_path.stem}-{'[0-9a-f]' * 16}.parquet"):
+            obsoleto.unlink()
+        df.to_parquet(cache_path, compression="zstd", index=False)
+    except Exception as e:
+        logger.warning("No se pudo escribir cache Parquet para %s: %s", file_path.name, e)
+    
+    return df
+
+
+def _normalizar(valores: list, unicos: dict[object, str]) -> list[str]:
+    """
+    Convierte cada valor a texto sin espacios en los extremos
+    Los valores repetidos comparten un único str internado, guardado en unicos
+    """
+    normalizados = []
+    for valor in valores:
+        texto = unicos.get(valor)
+        if texto is None:
+            texto = unicos[valor] = sys.intern(str(valor).strip())
+        normalizados.append(texto)
+    return normalizados
+
+
+def _texto(valor: object) -> str:
+    """Texto sin espacios en los extremos, internado"""
+    return sys.intern(str(valor).strip())
+
+
+def _periodo(valor: object) -> Periodo | Exception:
+    """Periodo del valor, o el error de validación para reportarlo por fila"""
+    try:
+        return Periodo.from_string(str(valor).strip())
+    except ValueError as e:
+        return e
+
+
+def _por_categoria(columna: pd.Series, convertir: Callable[[object], T]) -> list[T]:
+    """
+    Convierte una columna category aplicando convertir una vez por categoría
+    Cada fila toma el resultado de su categoría a partir del código entero
+    """
+    if not isinstance(columna.dtype, pd.CategoricalDtype):
+        columna = columna.astype('category')
+    # El código -1 (valor vacío) toma el último elemento
+    convertidos = [convertir(c) for c in columna.cat.categories.tolist()]
+    convertidos.append(convertir(np.nan))
+    return [convertidos[codigo] for codigo in columna.cat.codes.tolist()]
+
 
 class PreguntaCSVParser:
     """
@@ -24,20 +131,23 @@ class PreguntaCSVParser:
     Responsabilidad: Convertir CSV → List[Pregunta]
     """
     
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, cache_dir: Optional[Path] = None):
         self.file_path = file_path
+        self.cache_dir = cache_dir
         self._df: Optional[pd.DataFrame] = None
     
     def load(self) -> None:
-        """Carga el archivo CSV"""
+        """Carga el archivo CSV (o su copia Parquet si está vigente)"""
         try:
-            self._df = pd.read_csv(
+            self._df = _leer_csv_con_cache(
                 self.file_path,
+                self.cache_dir,
                 sep=';',
                 encoding='latin-1',  # Cambio a latin-1 para caracteres especiales
-                dtype=str
+                dtype=str,
+                engine='pyarrow',  # Lectura multihilo
             )
-            logger.info(f"Cargadas {len(self._df)} preguntas desde {self.file_path}")
+            logger.info("Cargadas %s preguntas desde %s", len(self._df), self.file_path)
         except Exception as e:
             raise DataParsingError(str(self.file_path), str(e))
     
@@ -49,31 +159,36 @@ class PreguntaCSVParser:
         if self._df is None:
             self.load()
         
+        try:
+            # Espacios en los extremos quitados por columna, no por fila
+            columnas = self._df[['IDPREGUNTA', 'CATEGORIA', 'PREGUNTA']].apply(
+                lambda columna: columna.str.strip()
+            )
+        except KeyError as e:
+            logger.warning("Columna requerida ausente en %s: %s", self.file_path.name, e)
+            return []
+        
         preguntas: list[Pregunta] = []
         
-        for _, row in self._df.iterrows():
+        for codigo, categoria_str, texto in columnas.itertuples(index=False, name=None):
             try:
-                pregunta = self._crear_pregunta(row)
+                pregunta = self._crear_pregunta(str(codigo), str(categoria_str), str(texto))
                 preguntas.append(pregunta)
             except Exception as e:
-                logger.warning(f"Error parseando pregunta {row.get('IDPREGUNTA', 'UNKNOWN')}: {e}")
+                logger.warning("Error parseando pregunta %s: %s", codigo, e)
                 continue
         
-        logger.info(f"Parseadas {len(preguntas)} preguntas exitosamente")
+        logger.info("Parseadas %s preguntas exitosamente", len(preguntas))
         return preguntas
     
-    def _crear_pregunta(self, row: pd.Series) -> Pregunta:
-        """Factory method para crear una Pregunta desde una fila"""
-        codigo = str(row['IDPREGUNTA']).strip()
-        categoria_str = str(row['CATEGORIA']).strip()
-        texto = str(row['PREGUNTA']).strip()
-        
+    def _crear_pregunta(self, codigo: str, categoria_str: str, texto: str) -> Pregunta:
+        """Factory method para crear una Pregunta desde los campos de una fila"""
         # Mapear categoría usando el factory method del enum
         try:
             categoria = Categoria.from_string(categoria_str)
         except ValueError:
             # Si no se encuentra, asignar a COMENTARIOS como fallback
-            logger.warning(f"Categoría no reconocida '{categoria_str}' para pregunta {codigo}")
+            logger.warning("Categoría no reconocida '%s' para pregunta %s", categoria_str, codigo)
             categoria = Categoria.COMENTARIOS
         
         return Pregunta(
@@ -90,82 +205,144 @@ class EvaluacionCSVParser:
     Requiere catálogo de preguntas para mapear columnas
     """
     
-    def __init__(self, file_path: Path, preguntas: list[Pregunta]):
+    def __init__(
+        self,
+        file_path: Path,
+        preguntas: list[Pregunta],
+        cache_dir: Optional[Path] = None,
+    ):
         self.file_path = file_path
         self.preguntas = preguntas
+        self.cache_dir = cache_dir
         # Crear índice de preguntas por código para búsqueda rápida
         self._preguntas_dict = {p.codigo: p for p in preguntas}
         self._df: Optional[pd.DataFrame] = None
     
     def load(self) -> None:
-        """Carga el archivo CSV"""
+        """Carga el archivo CSV (o su copia Parquet si está vigente)"""
         try:
-            self._df = pd.read_csv(
+            self._df = _leer_csv_con_cache(
                 self.file_path,
+                self.cache_dir,
                 sep=';',
-                encoding='latin-1'  # Cambio a latin-1 para caracteres especiales
+                encoding='latin-1',  # Cambio a latin-1 para caracteres especiales
+                dtype=_EVALUACION_DTYPES,
+                usecols=self._columnas_usadas(),
+                engine='pyarrow',  # Lectura multihilo
             )
-            logger.info(f"Cargadas {len(self._df)} evaluaciones desde {self.file_path}")
+            logger.info("Cargadas %s evaluaciones desde %s", len(self._df), self.file_path)
         except Exception as e:
             raise DataParsingError(str(self.file_path), str(e))
     
+    def _columnas_usadas(self) -> list[str]:
+        """
+        Columnas del encabezado que son metadatos o preguntas del catálogo
+        Las demás columnas del archivo no se leen
+        """
+        with open(self.file_path, encoding='latin-1', newline='') as f:
+            encabezado = next(csv.reader(f, delimiter=';'), [])
+        return [
+            columna for columna in encabezado
+            if columna in _COLUMNAS_METADATOS or columna in self._preguntas_dict
+        ]
+    
     def parse(self) -> list[Evaluacion]:
         """Convierte DataFrame a lista de entidades Evaluacion"""
+        return list(self.parse_iter())
+    
+    def parse_iter(self, chunksize: int = _FILAS_POR_BLOQUE) -> Iterator[Evaluacion]:
+        """
+        Genera las entidades Evaluacion recorriendo el DataFrame por bloques
+        Las calificaciones de cada bloque se convierten por columnas a una
+        matriz numérica; las filas se recorren como listas de Python, sin
+        crear un Series por fila ni materializar la matriz del archivo completo
+        """
         if self._df is None:
             self.load()
         
-        evaluaciones: list[Evaluacion] = []
+        df = self._df
         
-        for _, row in self._df.iterrows():
-            try:
-                evaluacion = self._crear_evaluacion(row)
-                evaluaciones.append(evaluacion)
-            except Exception as e:
-                logger.warning(f"Error parseando evaluación ID {row.get('PEGE_ID', 'UNKNOWN')}: {e}")
-                continue
+        faltantes = [c for c in _COLUMNAS_METADATOS if c not in df.columns]
+        if faltantes:
+            logger.warning("Columnas requeridas ausentes en %s: %s", self.file_path.name, faltantes)
+            return
         
-        logger.info(f"Parseadas {len(evaluaciones)} evaluaciones exitosamente")
-        return evaluaciones
-    
-    def _crear_evaluacion(self, row: pd.Series) -> Evaluacion:
-        """Factory method para crear una Evaluacion desde una fila"""
-        # Datos básicos
-        evaluacion_id = str(row['PEGE_ID'])
-        documento = str(row['DOCUMENTO']).strip()
-        nombre = str(row['NOMBRECOMPLETO']).strip()
-        periodo = Periodo(str(row['PERIODO']).strip())
-        tipo_formulario = str(row['FORMULARIO']).strip()
-        
-        # Crear evaluación
-        evaluacion = Evaluacion(
-            id=evaluacion_id,
-            profesor_documento=documento,
-            profesor_nombre=nombre,
-            periodo=periodo,
-            tipo_formulario=tipo_formulario
-        )
+        # Preguntas con columna en el archivo, en el orden del catálogo
+        preguntas = [
+            pregunta for codigo, pregunta in self._preguntas_dict.items()
+            if codigo in df.columns
+        ]
+        codigos = [p.codigo for p in preguntas]
         
-        # Procesar respuestas (columnas P147, P148, etc.)
-        for codigo_pregunta, pregunta in self._preguntas_dict.items():
-            if codigo_pregunta in row.index:
-                calificacion = self._parse_calificacion(row[codigo_pregunta])
-                evaluacion.agregar_respuesta(pregunta, calificacion)
+        # Una Calificacion por valor distinto, compartida entre bloques
+        calificaciones: dict[float, Calificacion] = {}
+        # Un único str por documento distinto
+        documentos: dict[object, str] = {}
+        total = 0
         
-        return evaluacion
-    
-    def _parse_calificacion(self, valor: any) -> Optional[Calificacion]:
-        """
-        Convierte valor del CSV a Calificacion
-        Maneja valores vacíos/None
-        """
-        if pd.isna(valor) or valor == '' or valor is None:
-            return None
+        for inicio in range(0, len(df), chunksize):
+            bloque = df.iloc[inicio:inicio + chunksize]
+            matriz = (
+                bloque[codigos]
+                .apply(pd.to_numeric, errors='coerce')
+                .to_numpy(dtype=np.float64)
+            )
+            
+            # Rango de la escala validado sobre la matriz completa (NaN no
+            # cumple ninguna comparación); un valor fuera de rango invalida
+            # la fila, como al validar celda por celda
+            fuera_de_rango = (
+                (matriz < Calificacion.MIN_VALOR) | (matriz > Calificacion.MAX_VALOR)
+            )
+            filas_invalidas = fuera_de_rango.any(axis=1)
+            
+            # Matriz de objetos Calificacion/None armada por indexación: una
+            # tabla con el objeto de cada valor distinto, expandida con el
+            # índice inverso de np.unique (NaN y fuera de rango → None)
+            distintos, inversa = np.unique(matriz, return_inverse=True)
+            tabla = np.empty(len(distintos), dtype=object)
+            for j, valor in enumerate(distintos.tolist()):
+                if Calificacion.MIN_VALOR <= valor <= Calificacion.MAX_VALOR:
+                    if valor not in calificaciones:
+                        calificaciones[valor] = Calificacion.from_valor(valor)
+                    tabla[j] = calificaciones[valor]
+            respuestas = tabla[inversa.reshape(matriz.shape)]
+            
+            columnas = zip(
+                range(len(bloque)),
+                bloque['PEGE_ID'].astype(str).tolist(),
+                _normalizar(bloque['DOCUMENTO'].tolist(), documentos),
+                _por_categoria(bloque['NOMBRECOMPLETO'], _texto),
+                _por_categoria(bloque['PERIODO'], _periodo),
+                _por_categoria(bloque['FORMULARIO'], _texto),
+                respuestas.tolist(),
+                filas_invalidas.tolist(),
+                strict=True,
+            )
+            
+            for i, pege_id, documento, nombre, periodo, formulario, fila, invalida in columnas:
+                try:
+                    if isinstance(periodo, Exception):
+                        raise periodo
+                    if invalida:
+                        raise InvalidCalificacionError(
+                            float(matriz[i][fuera_de_rango[i]][0])
+                        )
+                    evaluacion = Evaluacion(
+                        id=pege_id,
+                        profesor_documento=documento,
+                        profesor_nombre=nombre,
+                        periodo=periodo,
+                        tipo_formulario=formulario,
+                        respuestas=dict(zip(preguntas, fila, strict=True)),
+                    )
+                except Exception as e:
+                    logger.warning("Error parseando evaluación ID %s: %s", pege_id, e)
+                    continue
+                total += 1
+                yield evaluacion
         
-        try:
-            valor_float = float(valor)
-            return Calificacion(valor_float)
-        except (ValueError, TypeError):
-            return None
+        logger.info("Parseadas %s evaluaciones exitosamente", total)
 
 
 class EvaluacionDataLoader:
@@ -173,17 +350,32 @@ class EvaluacionDataLoader:
     Facade que coordina la carga completa de datos
     Aplicando Facade Pattern para simplificar la interfaz
     Soporta carga de múltiples archivos de evaluaciones
+    Si se indica cache_dir, reutiliza copias Parquet de los CSV entre arranques
     """
     
-    def __init__(self, data_dir: Path, preguntas_path: Path):
+    def __init__(
+        self,
+        data_dir: Path,
+        preguntas_path: Path,
+        cache_dir: Optional[Path] = None,
+    ):
         self.data_dir = data_dir
         self.preguntas_path = preguntas_path
+        self.cache_dir = cache_dir
+        # Archivos usados en la última carga
+        self._archivos: list[Path] = []
+        # Snapshot de los Evaluacion*.csv del directorio (ver invalidate())
+        self._evaluacion_files: Optional[list[Path]] = None
     
     def _find_evaluacion_files(self) -> list[Path]:
         """
         Busca todos los archivos CSV de evaluaciones en el directorio
         Patrones soportados: Evaluacion*.csv, evaluacion*.csv
+        El resultado se conserva hasta llamar a invalidate()
         """
+        if self._evaluacion_files is not None:
+            return self._evaluacion_files
+        
         evaluacion_files = []
         
         # Buscar archivos que empiecen con "Evaluacion" o "evaluacion"
@@ -194,12 +386,28 @@ class EvaluacionDataLoader:
         evaluacion_files.sort()
         
         if not evaluacion_files:
-            logger.warning(f"No se encontraron archivos de evaluación en {self.data_dir}")
+            logger.warning("No se encontraron archivos de evaluación en %s", self.data_dir)
         else:
-            logger.info(f"Encontrados {len(evaluacion_files)} archivos de evaluación: {[f.name for f in evaluacion_files]}")
+            logger.info("Encontrados %s archivos de evaluación: %s", len(evaluacion_files), [f.name for f in evaluacion_files])
         
+        self._evaluacion_files = evaluacion_files
         return evaluacion_files
     
+    def invalidate(self) -> None:
+        """Descarta el listado de archivos para volver a buscarlos en la próxima carga"""
+        self._evaluacion_files = None
+    
+    def data_version(self) -> str:
+        """
+        Huella de los archivos de la última carga (nombre, tamaño y mtime)
+        Identifica la versión de los datos servidos, p. ej. para ETags HTTP
+        """
+        partes = []
+        for archivo in self._archivos:
+            stat = archivo.stat()
+            partes.append(f"{archivo.name}:{stat.st_size}:{stat.st_mtime_ns}")
+        return hashlib.sha1("|".join(partes).encode()).hexdigest()[:16]
+    
     def load_all(self) -> tuple[list[Evaluacion], list[Pregunta]]:
         """
         Carga todos los datos en el orden correcto
@@ -209,7 +417,7 @@ class EvaluacionDataLoader:
         logger.info("Iniciando carga de datos...")
         
         # 1. Cargar preguntas primero (necesarias para las evaluaciones)
-        pregunta_parser = PreguntaCSVParser(self.preguntas_path)
+        pregunta_parser = PreguntaCSVParser(self.preguntas_path, self.cache_dir)
         preguntas = pregunta_parser.parse()
         
         # 2. Buscar todos los archivos de evaluaciones
@@ -221,17 +429,19 @@ class EvaluacionDataLoader:
                 "No se encontraron archivos de evaluación (Evaluacion*.csv)"
             )
         
+        self._archivos = [self.preguntas_path, *evaluacion_files]
+        
         # 3. Cargar y combinar todas las evaluaciones
         todas_evaluaciones: list[Evaluacion] = []
         
         for eval_file in evaluacion_files:
-            logger.info(f"Cargando evaluaciones desde {eval_file.name}...")
-            evaluacion_parser = EvaluacionCSVParser(eval_file, preguntas)
-            evaluaciones = evaluacion_parser.parse()
-            todas_evaluaciones.extend(evaluaciones)
-            logger.info(f"  → {len(evaluaciones)} evaluaciones cargadas desde {eval_file.name}")
-        
-        logger.info(f"Carga completa: {len(todas_evaluaciones)} evaluaciones totales, {len(preguntas)} preguntas")
-        logger.info(f"Archivos procesados: {len(evaluacion_files)}")
+            logger.info("Cargando evaluaciones desde %s...", eval_file.name)
+            evaluacion_parser = EvaluacionCSVParser(eval_file, preguntas, self.cache_dir)
+            cargadas = len(todas_evaluaciones)
+            todas_evaluaciones.extend(evaluacion_parser.parse_iter())
+            logger.info("  → %s evaluaciones cargadas desde %s", len(todas_evaluaciones) - cargadas, eval_file.name)
+        
+        logger.info("Carga completa: %s evaluaciones totales, %s preguntas", len(todas_evaluaciones), len(preguntas))
+        logger.info("Archivos procesados: %s", len(evaluacion_files))
         
         return todas_evaluaciones, preguntas
@@ -3,7 +3,8 @@ Pandas Repository Implementation
 Implementa las interfaces del dominio usando Pandas DataFrames en memoria
 Aplicando Repository Pattern y Dependency Inversion
 """
-from typing import Optional
+from collections.abc import Iterator, Sequence
+from typing import Optional, TypeVar
 from collections import defaultdict
 
 from app.domain.repositories.i_repository import IEvaluacionRepository, IPreguntaRepository
@@ -14,6 +15,13 @@ from app.domain.entities.categoria import Categoria
 from app.domain.value_objects.periodo import Periodo
 from app.core.exceptions import ProfesorNotFoundError
 
+K = TypeVar("K")
+
+
+def _congelar(index: dict[K, list[Evaluacion]]) -> dict[K, tuple[Evaluacion, ...]]:
+    """Convierte las listas de un índice en tuplas de solo lectura"""
+    return {clave: tuple(evaluaciones) for clave, evaluaciones in index.items()}
+
 
 class PandasPreguntaRepository(IPreguntaRepository):
     """
@@ -57,83 +65,88 @@ class PandasEvaluacionRepository(IEvaluacionRepository):
     """
     
     def __init__(self, evaluaciones: list[Evaluacion]):
-        self._evaluaciones = evaluaciones
-        # Construir índices para búsquedas O(1)
-        self._by_id = {e.id: e for e in evaluaciones}
-        self._by_profesor = self._build_profesor_index()
-        self._by_periodo = self._build_periodo_index()
-        self._by_tipo_formulario = self._build_tipo_formulario_index()
-    
-    def _build_profesor_index(self) -> dict[str, list[Evaluacion]]:
-        """Índice por documento de profesor"""
-        index: dict[str, list[Evaluacion]] = defaultdict(list)
-        for evaluacion in self._evaluaciones:
-            index[evaluacion.profesor_documento].append(evaluacion)
-        return dict(index)
+        self._evaluaciones = tuple(evaluaciones)
+        # Construir índices para búsquedas O(1) en una sola pasada
+        self._by_id: dict[str, Evaluacion] = {}
+        self._build_indices()
+        self._profesores = self._build_profesores()
     
-    def _build_periodo_index(self) -> dict[Periodo, list[Evaluacion]]:
-        """Índice por período"""
-        index: dict[Periodo, list[Evaluacion]] = defaultdict(list)
-        for evaluacion in self._evaluaciones:
-            index[evaluacion.periodo].append(evaluacion)
-        return dict(index)
-    
-    def _build_tipo_formulario_index(self) -> dict[str, list[Evaluacion]]:
-        """Índice por tipo de formulario"""
-        index: dict[str, list[Evaluacion]] = defaultdict(list)
+    def _build_indices(self) -> None:
+        """
+        Recorre las evaluaciones una vez: precalcula sus sumas por categoría
+        y construye los índices por ID, profesor, período, (profesor, período)
+        y tipo de formulario
+        """
+        by_profesor: dict[str, list[Evaluacion]] = defaultdict(list)
+        by_periodo: dict[Periodo, list[Evaluacion]] = defaultdict(list)
+        by_profesor_periodo: dict[tuple[str, Periodo], list[Evaluacion]] = defaultdict(list)
+        by_tipo_formulario: dict[str, list[Evaluacion]] = defaultdict(list)
+        
         for evaluacion in self._evaluaciones:
-            index[evaluacion.tipo_formulario].append(evaluacion)
-        return dict(index)
+            evaluacion.freeze()
+            self._by_id[evaluacion.id] = evaluacion
+            by_profesor[evaluacion.profesor_documento].append(evaluacion)
+            by_periodo[evaluacion.periodo].append(evaluacion)
+            by_profesor_periodo[
+                (evaluacion.profesor_documento, evaluacion.periodo)
+            ].append(evaluacion)
+            by_tipo_formulario[evaluacion.tipo_formulario].append(evaluacion)
+        
+        self._by_profesor = _congelar(by_profesor)
+        self._by_periodo = _congelar(by_periodo)
+        self._by_profesor_periodo = _congelar(by_profesor_periodo)
+        self._by_tipo_formulario = _congelar(by_tipo_formulario)
     
-    def find_all(self) -> list[Evaluacion]:
-        """Obtiene todas las evaluaciones"""
-        return self._evaluaciones.copy()
+    def find_all(self) -> Sequence[Evaluacion]:
+        """Obtiene todas las evaluaciones (tupla de solo lectura, sin copia)"""
+        return self._evaluaciones
     
     def find_by_id(self, evaluacion_id: str) -> Optional[Evaluacion]:
         """Busca una evaluación por su ID - O(1)"""
         return self._by_id.get(evaluacion_id)
     
-    def find_by_profesor(self, documento: str) -> list[Evaluacion]:
+    def find_by_profesor(self, documento: str) -> Sequence[Evaluacion]:
         """Obtiene todas las evaluaciones de un profesor - O(1)"""
-        return self._by_profesor.get(documento, []).copy()
+        return self._by_profesor.get(documento, ())
     
-    def find_by_periodo(self, periodo: Periodo) -> list[Evaluacion]:
+    def find_by_periodo(self, periodo: Periodo) -> Sequence[Evaluacion]:
         """Obtiene todas las evaluaciones de un período - O(1)"""
-        return self._by_periodo.get(periodo, []).copy()
+        return self._by_periodo.get(periodo, ())
     
     def find_by_profesor_and_periodo(
         self, 
         documento: str, 
         periodo: Periodo
-    ) -> list[Evaluacion]:
-        """Obtiene evaluaciones de un profesor en un período - O(n) donde n = evals del profesor"""
-        evaluaciones_profesor = self._by_profesor.get(documento, [])
-        return [e for e in evaluaciones_profesor if e.periodo == periodo]
+    ) -> Sequence[Evaluacion]:
+        """Obtiene evaluaciones de un profesor en un período - O(1)"""
+        return self._by_profesor_periodo.get((documento, periodo), ())
     
-    def find_by_tipo_formulario(self, tipo: str) -> list[Evaluacion]:
+    def find_by_tipo_formulario(self, tipo: str) -> Sequence[Evaluacion]:
         """Obtiene evaluaciones por tipo de formulario - O(1)"""
-        return self._by_tipo_formulario.get(tipo, []).copy()
+        return self._by_tipo_formulario.get(tipo, ())
+    
+    def _build_profesores(self) -> list[Profesor]:
+        """Agregados Profesor desde el índice por documento, en orden de aparición"""
+        return [
+            Profesor(
+                documento=documento,
+                nombre_completo=evaluaciones[0].profesor_nombre,
+                # Sin duplicados por ID, como Profesor.agregar_evaluacion
+                evaluaciones=list(dict.fromkeys(evaluaciones)),
+            )
+            for documento, evaluaciones in self._by_profesor.items()
+        ]
     
     def get_profesores(self) -> list[Profesor]:
         """
         Obtiene lista de todos los profesores evaluados
-        Construye agregado Profesor con sus evaluaciones
+        Agregado Profesor con sus evaluaciones, construido una vez al cargar
         """
-        profesores: dict[str, Profesor] = {}
-        
-        for evaluacion in self._evaluaciones:
-            documento = evaluacion.profesor_documento
-            
-            if documento not in profesores:
-                profesores[documento] = Profesor(
-                    documento=documento,
-                    nombre_completo=evaluacion.profesor_nombre,
-                    evaluaciones=[]
-                )
-            
-            profesores[documento].agregar_evaluacion(evaluacion)
-        
-        return list(profesores.values())
+        return self._profesores.copy()
+    
+    def iter_profesores(self) -> Iterator[Profesor]:
+        """Itera los profesores en el mismo orden que get_profesores()"""
+        return iter(self._profesores)
     
     def get_periodos_disponibles(self) -> list[Periodo]:
         """Obtiene lista de períodos con evaluaciones, ordenados"""
@@ -143,3 +156,17 @@ class PandasEvaluacionRepository(IEvaluacionRepository):
     def get_tipos_formulario(self) -> list[str]:
         """Obtiene lista de tipos de formulario (actores)"""
         return list(self._by_tipo_formulario.keys())
+    
+    def count_by_periodo(self) -> dict[Periodo, int]:
+        """Cuenta evaluaciones por período usando el índice - O(p log p)"""
+        return {
+            periodo: len(self._by_periodo[periodo])
+            for periodo in sorted(self._by_periodo)
+        }
+    
+    def count_by_tipo_formulario(self) -> dict[str, int]:
+        """Cuenta evaluaciones por tipo de formulario usando el índice - O(t)"""
+        return {
+            tipo: len(evaluaciones)
+            for tipo, evaluaciones in self._by_tipo_formulario.items()
+        }
@@ -5,22 +5,248 @@ Compatible con Windows sin dependencias externas
 """
 from io import BytesIO
 from datetime import datetime
+from collections.abc import Sequence
+from functools import cache
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus import Flowable, SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from app.application.dtos.profesor_dtos import PromedioProfesorResponse
 from app.application.dtos.mejora_dtos import PropuestaMejoraResponse
 
 
+# Colores institucionales
+PRIMARY_COLOR = colors.Color(0/255, 69/255, 137/255)  # rgb(0,69,137)
+SECONDARY_COLOR = colors.Color(255/255, 237/255, 0/255)  # #ffed00
+ESTADO_COLOR = colors.Color(0.9, 0.9, 0.9)  # Gris claro, igual para todos los estados
+
+# Estado del promedio general: (umbral mínimo, nombre), de mayor a menor
+_ESTADOS: tuple[tuple[float, str], ...] = (
+    (4.5, "Excelente"),
+    (4.0, "Muy Bueno"),
+    (3.5, "Bueno"),
+)
+_ESTADO_POR_DEFECTO = "Necesita Mejorar"
+
+# Anchos de columna de las tablas del reporte
+_INFO_COL_WIDTHS = (2*inch, 4.5*inch)
+_STATS_COL_WIDTHS = (2.5*inch, 2*inch, 2*inch)
+_RESULTADOS_COL_WIDTHS = (4*inch, 1.25*inch, 1.25*inch)
+_REC_COL_WIDTHS = (6.5*inch,)
+
+# Ancho útil de la columna de nombres en las tablas de resultados
+# (menos el padding izquierdo y derecho de 12 puntos)
+_ANCHO_NOMBRE = _RESULTADOS_COL_WIDTHS[0] - 2*12
+
+
+def _flowables_exito() -> tuple[Paragraph, ...]:
+    """
+    Mensaje fijo de los reportes sin categorías a mejorar
+    Los Paragraph se crean en cada llamada porque platypus guarda estado
+    en cada flowable al ajustarlo; solo los estilos se reutilizan
+    """
+    estilos = _estilos()
+    return (
+        Paragraph("✓ ¡Excelente desempeño!", estilos['success']),
+        Paragraph("Todas las categorías tienen calificaciones superiores a 4.0", estilos['subtitle']),
+    )
+
+
+def _celda_texto(texto: str, estilo: ParagraphStyle) -> str | Paragraph:
+    """
+    Texto plano si cabe en una línea de la columna de nombres; si no, un
+    Paragraph para que se ajuste. Table dibuja el texto plano sin el
+    parseo de markup ni el cálculo de líneas de Paragraph
+    """
+    if stringWidth(texto, estilo.fontName, estilo.fontSize) <= _ANCHO_NOMBRE:
+        return texto
+    return Paragraph(texto, estilo)
+
+
+@cache
+def _estilos() -> dict[str, ParagraphStyle]:
+    """
+    Estilos de párrafo del reporte
+    Se construyen una vez por proceso: getSampleStyleSheet y ParagraphStyle
+    son costosos y los estilos no cambian entre reportes
+    """
+    styles = getSampleStyleSheet()
+    
+    return {
+        # Estilo personalizado para el título
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=PRIMARY_COLOR,
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        'subtitle': ParagraphStyle(
+            'Subtitle',
+            parent=styles['Normal'],
+            fontSize=12,
+            textColor=colors.grey,
+            spaceAfter=6,
+            alignment=TA_CENTER
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=PRIMARY_COLOR,
+            spaceAfter=12,
+            spaceBefore=12,
+            fontName='Helvetica-Bold'
+        ),
+        # Estilo para texto de categorías
+        'cat_text': ParagraphStyle(
+            'CatText',
+            parent=styles['Normal'],
+            fontSize=10,
+            fontName='Helvetica'
+        ),
+        'success': ParagraphStyle(
+            'Success',
+            parent=styles['Normal'],
+            fontSize=14,
+            textColor=colors.green,
+            alignment=TA_CENTER,
+            spaceAfter=12,
+            fontName='Helvetica-Bold'
+        ),
+        # Categoría con promedio
+        'cat_title': ParagraphStyle(
+            'CategoryTitle',
+            parent=styles['Normal'],
+            fontSize=13,
+            textColor=colors.Color(0.6, 0.3, 0),
+            spaceAfter=8,
+            fontName='Helvetica-Bold'
+        ),
+        # Estilo para texto de recomendaciones
+        'rec_text': ParagraphStyle(
+            'RecText',
+            parent=styles['Normal'],
+            fontSize=9,
+            leading=11
+        ),
+        'rec_title': ParagraphStyle(
+            'RecTitle',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=PRIMARY_COLOR,
+            fontName='Helvetica-Bold',
+            leading=11
+        ),
+        'footer': ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=colors.grey,
+            alignment=TA_CENTER
+        ),
+    }
+
+
 class PDFGenerator:
     """Genera PDFs con diseño profesional manteniendo el estilo del frontend"""
     
     # Colores institucionales
-    PRIMARY_COLOR = colors.Color(0/255, 69/255, 137/255)  # rgb(0,69,137)
-    SECONDARY_COLOR = colors.Color(255/255, 237/255, 0/255)  # #ffed00
+    PRIMARY_COLOR = PRIMARY_COLOR
+    SECONDARY_COLOR = SECONDARY_COLOR
+    
+    # Estilos de tabla estáticos: se construyen una vez al importar y se
+    # comparten entre reportes (setStyle no los modifica)
+    _INFO_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.Color(0.95, 0.95, 0.95)),
+        ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 11),
+        ('PADDING', (0, 0), (-1, -1), 12),
+        ('LEFTPADDING', (0, 0), (-1, -1), 15),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 15),
+        ('GRID', (0, 0), (-1, -1), 1, colors.Color(0.8, 0.8, 0.8))
+    ])
+    
+    _STATS_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (0, 0), PRIMARY_COLOR),
+        ('BACKGROUND', (1, 0), (1, 0), ESTADO_COLOR),
+        ('BACKGROUND', (2, 0), (2, 0), ESTADO_COLOR),
+        ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
+        ('TEXTCOLOR', (1, 0), (1, 0), colors.black),
+        ('TEXTCOLOR', (2, 0), (2, 0), colors.black),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 14),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 15),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 15),
+        ('LEFTPADDING', (0, 0), (-1, -1), 18),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 18),
+        ('GRID', (0, 0), (-1, -1), 1, colors.Color(0.8, 0.8, 0.8))
+    ])
+    
+    # Compartido por las tablas de categorías y de tipos de evaluador
+    _RESULTADOS_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('PADDING', (0, 0), (-1, -1), 10),
+        ('LEFTPADDING', (0, 0), (-1, -1), 12),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+        ('GRID', (0, 0), (-1, -1), 1, colors.Color(0.8, 0.8, 0.8)),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.Color(0.95, 0.95, 0.95)]),
+        ('WORDWRAP', (0, 0), (-1, -1), True)
+    ])
+    
+    _REC_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (0, 0), colors.Color(0.85, 0.85, 0.95)),
+        ('BACKGROUND', (0, 2), (0, 2), colors.Color(0.93, 0.96, 1)),
+        ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (0, 0), 10),
+        ('TOPPADDING', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+        ('LEFTPADDING', (0, 0), (-1, -1), 15),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 15),
+        ('BOX', (0, 0), (-1, -1), 1, colors.Color(0.7, 0.7, 0.7)),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP')
+    ])
+    
+    @staticmethod
+    def warm_up() -> None:
+        """
+        Renderiza un documento mínimo con las fuentes y estilos del reporte
+        Carga una vez por proceso las métricas de fuentes y los estilos, de
+        modo que el primer reporte real no pague ese costo
+        """
+        estilos = _estilos()
+        story = [Paragraph(f"<b>{nombre}</b> {nombre}", estilo) for nombre, estilo in estilos.items()]
+        tabla = Table([["Categoría", "Promedio"], [Paragraph("-", estilos['cat_text']), "0.00"]])
+        tabla.setStyle(PDFGenerator._RESULTADOS_TABLE_STYLE)
+        story.append(tabla)
+        SimpleDocTemplate(BytesIO(), pagesize=letter).build(story)
+    
+    @staticmethod
+    def render_profesor_report(
+        promedios: PromedioProfesorResponse,
+        mejoras: PropuestaMejoraResponse
+    ) -> bytes:
+        """
+        Genera el reporte y retorna su contenido en bytes
+        Pensado para ejecutarse en un pool de procesos (resultado serializable)
+        """
+        return PDFGenerator.generate_profesor_report(promedios, mejoras).getvalue()
     
     @staticmethod
     def generate_profesor_report(
@@ -38,7 +264,59 @@ class PDFGenerator:
             BytesIO con el contenido del PDF
         """
         buffer = BytesIO()
-        doc = SimpleDocTemplate(
+        
+        # Construir contenido
+        story: list[Flowable] = []
+        PDFGenerator._build_profesor_story(promedios, mejoras, story)
+        
+        # Generar PDF
+        PDFGenerator._crear_documento(buffer).build(story)
+        buffer.seek(0)
+        
+        return buffer
+    
+    @staticmethod
+    def render_batch_report(
+        items: Sequence[tuple[PromedioProfesorResponse, PropuestaMejoraResponse]]
+    ) -> bytes:
+        """
+        Genera el reporte de varios profesores y retorna su contenido en bytes
+        Pensado para ejecutarse en un pool de procesos (resultado serializable)
+        """
+        return PDFGenerator.generate_batch_report(items).getvalue()
+    
+    @staticmethod
+    def generate_batch_report(
+        items: Sequence[tuple[PromedioProfesorResponse, PropuestaMejoraResponse]]
+    ) -> BytesIO:
+        """
+        Genera un único PDF con el reporte de varios profesores
+        Cada reporte empieza en una página nueva; el documento se construye
+        una sola vez para todos
+        
+        Args:
+            items: Pares (promedios, propuestas de mejora), uno por profesor
+            
+        Returns:
+            BytesIO con el contenido del PDF
+        """
+        buffer = BytesIO()
+        
+        story: list[Flowable] = []
+        for i, (promedios, mejoras) in enumerate(items):
+            if i:
+                story.append(PageBreak())
+            PDFGenerator._build_profesor_story(promedios, mejoras, story)
+        
+        PDFGenerator._crear_documento(buffer).build(story)
+        buffer.seek(0)
+        
+        return buffer
+    
+    @staticmethod
+    def _crear_documento(buffer: BytesIO) -> SimpleDocTemplate:
+        """Documento tamaño carta con los márgenes del reporte"""
+        return SimpleDocTemplate(
             buffer,
             pagesize=letter,
             rightMargin=0.75*inch,
@@ -46,42 +324,20 @@ class PDFGenerator:
             topMargin=0.75*inch,
             bottomMargin=0.75*inch
         )
-        
+    
+    @staticmethod
+    def _build_profesor_story(
+        promedios: PromedioProfesorResponse,
+        mejoras: PropuestaMejoraResponse,
+        story: list[Flowable],
+    ) -> None:
+        """Agrega al story los flowables del reporte de un profesor"""
         # Estilos
-        styles = getSampleStyleSheet()
-        
-        # Estilo personalizado para el título
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=PDFGenerator.PRIMARY_COLOR,
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
-        
-        subtitle_style = ParagraphStyle(
-            'Subtitle',
-            parent=styles['Normal'],
-            fontSize=12,
-            textColor=colors.grey,
-            spaceAfter=6,
-            alignment=TA_CENTER
-        )
+        estilos = _estilos()
+        title_style = estilos['title']
+        subtitle_style = estilos['subtitle']
+        heading_style = estilos['heading']
         
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=PDFGenerator.PRIMARY_COLOR,
-            spaceAfter=12,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Construir contenido
-        story = []
         
         # Header
         story.append(Paragraph("Reporte de Evaluación Docente", title_style))
@@ -97,18 +353,8 @@ class PDFGenerator:
             ["Período:", promedios.periodo or "Todos los períodos"],
             ["Total Evaluaciones:", str(promedios.total_evaluaciones)]
         ]
-        info_table = Table(info_data, colWidths=[2*inch, 4.5*inch])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.Color(0.95, 0.95, 0.95)),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.black),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('PADDING', (0, 0), (-1, -1), 12),
-            ('LEFTPADDING', (0, 0), (-1, -1), 15),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 15),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0.8, 0.8, 0.8))
-        ]))
+        info_table = Table(info_data, colWidths=_INFO_COL_WIDTHS)
+        info_table.setStyle(PDFGenerator._INFO_TABLE_STYLE)
         story.append(info_table)
         story.append(Spacer(1, 0.3*inch))
         
@@ -116,106 +362,51 @@ class PDFGenerator:
         story.append(Paragraph("Estadísticas Generales", heading_style))
         
         # Determinar estado
-        if promedios.promedio_general >= 4.5:
-            estado = "Excelente"
-            color_estado = colors.Color(0.9, 0.9, 0.9)  # Gris claro
-        elif promedios.promedio_general >= 4.0:
-            estado = "Muy Bueno"
-            color_estado = colors.Color(0.9, 0.9, 0.9)  # Gris claro
-        elif promedios.promedio_general >= 3.5:
-            estado = "Bueno"
-            color_estado = colors.Color(0.9, 0.9, 0.9)  # Gris claro
-        else:
-            estado = "Necesita Mejorar"
-            color_estado = colors.Color(0.9, 0.9, 0.9)  # Gris claro
+        estado = next(
+            (nombre for umbral, nombre in _ESTADOS if promedios.promedio_general >= umbral),
+            _ESTADO_POR_DEFECTO,
+        )
         
         stats_data = [
             ["Promedio General", f"{promedios.promedio_general:.2f}", estado]
         ]
-        stats_table = Table(stats_data, colWidths=[2.5*inch, 2*inch, 2*inch])
-        stats_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, 0), PDFGenerator.PRIMARY_COLOR),
-            ('BACKGROUND', (1, 0), (1, 0), color_estado),
-            ('BACKGROUND', (2, 0), (2, 0), color_estado),
-            ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
-            ('TEXTCOLOR', (1, 0), (1, 0), colors.black),
-            ('TEXTCOLOR', (2, 0), (2, 0), colors.black),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 14),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 15),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 15),
-            ('LEFTPADDING', (0, 0), (-1, -1), 18),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 18),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0.8, 0.8, 0.8))
-        ]))
+        stats_table = Table(stats_data, colWidths=_STATS_COL_WIDTHS)
+        stats_table.setStyle(PDFGenerator._STATS_TABLE_STYLE)
         story.append(stats_table)
         story.append(Spacer(1, 0.3*inch))
         
         # Tabla de Categorías
         story.append(Paragraph("Resultados por Categoría", heading_style))
         
-        # Estilo para texto de categorías
-        cat_text_style = ParagraphStyle(
-            'CatText',
-            parent=styles['Normal'],
-            fontSize=10,
-            fontName='Helvetica'
-        )
+        cat_text_style = estilos['cat_text']
         
-        cat_data = [["Categoría", "Promedio", "Evaluaciones"]]
-        for cat in promedios.promedios_por_categoria:
-            # Usar Paragraph para que el texto se ajuste automáticamente
-            cat_nombre = Paragraph(cat.categoria, cat_text_style)
-            cat_data.append([cat_nombre, f"{cat.promedio:.2f}", str(cat.total_evaluaciones)])
+        # Paragraph solo para los nombres que necesitan ajustarse en varias líneas
+        cat_data = [
+            ["Categoría", "Promedio", "Evaluaciones"],
+            *[
+                [_celda_texto(cat.categoria, cat_text_style), f"{cat.promedio:.2f}", str(cat.total_evaluaciones)]
+                for cat in promedios.promedios_por_categoria
+            ],
+        ]
         
-        cat_table = Table(cat_data, colWidths=[4*inch, 1.25*inch, 1.25*inch])
-        cat_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), PDFGenerator.PRIMARY_COLOR),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('PADDING', (0, 0), (-1, -1), 10),
-            ('LEFTPADDING', (0, 0), (-1, -1), 12),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0.8, 0.8, 0.8)),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.Color(0.95, 0.95, 0.95)]),
-            ('WORDWRAP', (0, 0), (-1, -1), True)
-        ]))
+        cat_table = Table(cat_data, colWidths=_RESULTADOS_COL_WIDTHS)
+        cat_table.setStyle(PDFGenerator._RESULTADOS_TABLE_STYLE)
         story.append(cat_table)
         story.append(Spacer(1, 0.3*inch))
         
         # Tabla de Evaluadores
         story.append(Paragraph("Resultados por Tipo de Evaluador", heading_style))
         
-        actor_data = [["Tipo de Evaluador", "Promedio", "Evaluaciones"]]
-        for actor in promedios.promedios_por_actor:
-            # Usar Paragraph para que el texto se ajuste automáticamente
-            actor_nombre = Paragraph(actor.actor, cat_text_style)
-            actor_data.append([actor_nombre, f"{actor.promedio:.2f}", str(actor.total_evaluaciones)])
+        actor_data = [
+            ["Tipo de Evaluador", "Promedio", "Evaluaciones"],
+            *[
+                [_celda_texto(actor.actor, cat_text_style), f"{actor.promedio:.2f}", str(actor.total_evaluaciones)]
+                for actor in promedios.promedios_por_actor
+            ],
+        ]
         
-        actor_table = Table(actor_data, colWidths=[4*inch, 1.25*inch, 1.25*inch])
-        actor_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), PDFGenerator.PRIMARY_COLOR),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('PADDING', (0, 0), (-1, -1), 10),
-            ('LEFTPADDING', (0, 0), (-1, -1), 12),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0.8, 0.8, 0.8)),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.Color(0.95, 0.95, 0.95)]),
-            ('WORDWRAP', (0, 0), (-1, -1), True)
-        ]))
+        actor_table = Table(actor_data, colWidths=_RESULTADOS_COL_WIDTHS)
+        actor_table.setStyle(PDFGenerator._RESULTADOS_TABLE_STYLE)
         story.append(actor_table)
         story.append(PageBreak())
         
@@ -223,28 +414,14 @@ class PDFGenerator:
         story.append(Paragraph("Propuestas de Mejora", heading_style))
         
         if not mejoras.categorias_a_mejorar:
-            success_style = ParagraphStyle(
-                'Success',
-                parent=styles['Normal'],
-                fontSize=14,
-                textColor=colors.green,
-                alignment=TA_CENTER,
-                spaceAfter=12,
-                fontName='Helvetica-Bold'
-            )
-            story.append(Paragraph("✓ ¡Excelente desempeño!", success_style))
-            story.append(Paragraph("Todas las categorías tienen calificaciones superiores a 4.0", subtitle_style))
+            story.extend(_flowables_exito())
         else:
+            cat_title = estilos['cat_title']
+            rec_text_style = estilos['rec_text']
+            rec_title_style = estilos['rec_title']
+            
             for cat_mejora in mejoras.categorias_a_mejorar:
                 # Categoría con promedio
-                cat_title = ParagraphStyle(
-                    'CategoryTitle',
-                    parent=styles['Normal'],
-                    fontSize=13,
-                    textColor=colors.Color(0.6, 0.3, 0),
-                    spaceAfter=8,
-                    fontName='Helvetica-Bold'
-                )
                 story.append(Paragraph(
                     f"{cat_mejora.categoria} - Promedio: {cat_mejora.promedio_categoria:.2f}",
                     cat_title
@@ -252,23 +429,6 @@ class PDFGenerator:
                 
                 # Recomendaciones
                 for rec in cat_mejora.recomendaciones:
-                    # Estilo para texto de recomendaciones
-                    rec_text_style = ParagraphStyle(
-                        'RecText',
-                        parent=styles['Normal'],
-                        fontSize=9,
-                        leading=11
-                    )
-                    
-                    rec_title_style = ParagraphStyle(
-                        'RecTitle',
-                        parent=styles['Normal'],
-                        fontSize=9,
-                        textColor=PDFGenerator.PRIMARY_COLOR,
-                        fontName='Helvetica-Bold',
-                        leading=11
-                    )
-                    
                     # Usar Paragraph para que el texto se ajuste
                     pregunta_text = Paragraph(f"<b>{rec.codigo_pregunta}:</b> {rec.texto_pregunta}", rec_text_style)
                     recomendacion_text = Paragraph(f"<b>💡 Recomendación:</b> {rec.recomendacion}", rec_title_style)
@@ -278,38 +438,15 @@ class PDFGenerator:
                         [pregunta_text],
                         [recomendacion_text]
                     ]
-                    rec_table = Table(rec_data, colWidths=[6.5*inch])
-                    rec_table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (0, 0), colors.Color(0.85, 0.85, 0.95)),
-                        ('BACKGROUND', (0, 2), (0, 2), colors.Color(0.93, 0.96, 1)),
-                        ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (0, 0), 10),
-                        ('TOPPADDING', (0, 0), (-1, -1), 10),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-                        ('LEFTPADDING', (0, 0), (-1, -1), 15),
-                        ('RIGHTPADDING', (0, 0), (-1, -1), 15),
-                        ('BOX', (0, 0), (-1, -1), 1, colors.Color(0.7, 0.7, 0.7)),
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP')
-                    ]))
+                    rec_table = Table(rec_data, colWidths=_REC_COL_WIDTHS)
+                    rec_table.setStyle(PDFGenerator._REC_TABLE_STYLE)
                     story.append(rec_table)
                     story.append(Spacer(1, 0.15*inch))
                 
                 story.append(Spacer(1, 0.2*inch))
         
         # Footer
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontSize=9,
-            textColor=colors.grey,
-            alignment=TA_CENTER
-        )
+        footer_style = estilos['footer']
         story.append(Spacer(1, 0.5*inch))
         story.append(Paragraph("Dashboard de Evaluaciones Docentes - Universidad", footer_style))
         story.append(Paragraph("Este reporte es confidencial y de uso exclusivo institucional", footer_style))
-        
-        # Generar PDF
-        doc.build(story)
-        buffer.seek(0)
-        
-        return buffer
@@ -2,24 +2,111 @@
 FastAPI Main Application
 Punto de entrada de la aplicación
 """
+from contextlib import asynccontextmanager, contextmanager
+from collections.abc import AsyncIterator, Iterator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from logging.handlers import QueueHandler, QueueListener
+import asyncio
 import logging
+import queue
 
 from app.core.config import get_settings
 from app.api.routes import profesores_router, estadisticas_router
-from app.api.dependencies import initialize_repositories
-
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+from app.api.dependencies import (
+    initialize_repositories,
+    crear_cache_pdfs,
+    crear_pdf_executor,
+    get_calcular_promedio_profesor_use_case,
 )
-logger = logging.getLogger(__name__)
 
 # Obtener settings
 settings = get_settings()
 
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def _logging_en_cola() -> Iterator[None]:
+    """
+    Configura el logging mientras la aplicación está en marcha: los
+    registros se encolan y un hilo aparte los formatea y escribe, así los
+    requests no se bloquean escribiendo en stderr
+    Solo corre en el lifespan, de modo que importar app.main (tests, workers
+    del pool de PDFs) no arranca hilos ni cambia los handlers del root logger
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    
+    # En el hilo del request solo se interpola el mensaje; fecha y formato
+    # final los aplica el handler del listener
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    root = logging.getLogger()
+    nivel_root = root.level
+    root.addHandler(queue_handler)
+    root.setLevel(logging.INFO)
+    logging.getLogger("app").setLevel(settings.log_level)
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        root.removeHandler(queue_handler)
+        root.setLevel(nivel_root)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Ciclo de vida de la aplicación
+    Carga los datos CSV una sola vez al iniciar, antes de atender requests,
+    y deja los repositorios y el pool de PDFs en app.state
+    """
+    with _logging_en_cola():
+        logger.info("Iniciando aplicación...")
+        logger.info("Versión: %s", settings.app_version)
+        
+        try:
+            # Inicializar repositorios (carga de datos) en un hilo, sin bloquear
+            # el event loop; initialize_repositories es thread-safe
+            evaluacion_repo, pregunta_repo, data_version = await asyncio.to_thread(
+                initialize_repositories
+            )
+            app.state.evaluacion_repo = evaluacion_repo
+            app.state.pregunta_repo = pregunta_repo
+            app.state.data_version = data_version
+            logger.info("Datos cargados exitosamente (versión %s)", data_version)
+        
+            # Precalcular promedios; la factory está memoizada por repositorio,
+            # así que los requests reciben esta misma instancia del use case
+            promedio_use_case = get_calcular_promedio_profesor_use_case(
+                evaluacion_repo=evaluacion_repo,
+            )
+            total = await asyncio.to_thread(promedio_use_case.precalcular)
+            logger.info("Promedios precalculados: %s", total)
+        except Exception as e:
+            logger.error("Error al cargar datos: %s", e)
+            raise
+        
+        # Pool de procesos para renderizar PDFs sin bloquear el event loop;
+        # cada worker importa y precalienta ReportLab al arrancar
+        app.state.pdf_executor = crear_pdf_executor()
+        # PDFs ya renderizados; una cache nueva por cada carga de datos
+        app.state.pdf_cache = crear_cache_pdfs()
+        
+        yield
+        
+        logger.info("Apagando aplicación...")
+        app.state.pdf_executor.shutdown(cancel_futures=True)
+
+
 # Crear aplicación FastAPI
 app = FastAPI(
     title=settings.app_name,
@@ -27,6 +114,8 @@ app = FastAPI(
     description="API para análisis de evaluaciones docentes con Clean Architecture",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # Serialización JSON en C (orjson)
+    lifespan=lifespan,
 )
 
 # Configurar CORS
@@ -39,30 +128,6 @@ app.add_middleware(
 )
 
 
-@app.on_event("startup")
-async def startup_event() -> None:
-    """
-    Evento que se ejecuta al iniciar la aplicación
-    Inicializa repositorios cargando datos CSV
-    """
-    logger.info("Iniciando aplicación...")
-    logger.info(f"Versión: {settings.app_version}")
-    
-    try:
-        # Inicializar repositorios (carga de datos)
-        initialize_repositories()
-        logger.info("Datos cargados exitosamente")
-    except Exception as e:
-        logger.error(f"Error al cargar datos: {e}")
-        raise
-
-
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """Evento que se ejecuta al apagar la aplicación"""
-    logger.info("Apagando aplicación...")
-
-
 @app.get("/")
 async def root() -> dict:
     """Endpoint raíz con información de la API"""
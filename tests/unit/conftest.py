@@ -0,0 +1,31 @@
+"""
+Fixtures compartidas por los tests unitarios
+"""
+from collections.abc import Callable
+from typing import Optional
+
+import pytest
+
+from app.domain.entities.evaluacion import Evaluacion
+from app.domain.value_objects.periodo import Periodo
+
+
+def _crear_evaluacion(
+    evaluacion_id: str = "1",
+    periodo: Optional[Periodo] = None,
+    tipo_formulario: str = "ESTUDIANTE V3",
+) -> Evaluacion:
+    """Evaluación sin respuestas del profesor 123456 (por defecto en 2025-2)"""
+    return Evaluacion(
+        id=evaluacion_id,
+        profesor_documento="123456",
+        profesor_nombre="Juan Pérez",
+        periodo=periodo or Periodo("2025-2"),
+        tipo_formulario=tipo_formulario
+    )
+
+
+@pytest.fixture
+def crear_evaluacion() -> Callable[..., Evaluacion]:
+    """Factory de evaluaciones de prueba; cada llamada crea una nueva"""
+    return _crear_evaluacion
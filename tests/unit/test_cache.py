@@ -0,0 +1,86 @@
+"""
+Test para la cache TTL de respuestas
+Aplicando principios de testing: AAA (Arrange, Act, Assert)
+"""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test suite para TTLCache"""
+
+    def test_reutiliza_el_valor_mientras_esta_vigente(self):
+        """Test: Un segundo acceso a la misma clave no recalcula"""
+        # Arrange
+        cache = TTLCache(maxsize=10, ttl=60)
+        calcular = Mock(return_value="valor")
+
+        # Act
+        primero = cache.get_or_compute("clave", calcular)
+        segundo = cache.get_or_compute("clave", calcular)
+
+        # Assert
+        assert primero == segundo == "valor"
+        calcular.assert_called_once()
+
+    def test_recalcula_cuando_expira(self):
+        """Test: Las entradas vencidas se recalculan"""
+        # Arrange
+        cache = TTLCache(maxsize=10, ttl=60)
+        calcular = Mock(side_effect=["viejo", "nuevo"])
+
+        # Act
+        with patch("app.core.cache.monotonic", return_value=0.0):
+            cache.get_or_compute("clave", calcular)
+        with patch("app.core.cache.monotonic", return_value=61.0):
+            resultado = cache.get_or_compute("clave", calcular)
+
+        # Assert
+        assert resultado == "nuevo"
+
+    def test_descarta_la_entrada_menos_usada_al_llenarse(self):
+        """Test: Respeta maxsize descartando la entrada menos reciente"""
+        # Arrange
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 1)
+
+        # Act
+        cache.get_or_compute("c", lambda: 3)
+
+        # Assert
+        assert len(cache) == 2
+        assert cache.get_or_compute("a", lambda: 0) == 1
+        assert cache.get_or_compute("b", lambda: 0) == 0
+
+    def test_no_guarda_excepciones(self):
+        """Test: Si el cálculo falla, la excepción se propaga y no se cachea"""
+        # Arrange
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            cache.get_or_compute("clave", Mock(side_effect=ValueError))
+        assert len(cache) == 0
+
+    def test_get_y_put_comparten_las_entradas(self):
+        """Test: put guarda un valor que get retorna hasta que expira"""
+        # Arrange
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        # Act
+        with patch("app.core.cache.monotonic", return_value=0.0):
+            antes = cache.get("clave")
+            cache.put("clave", b"pdf")
+            vigente = cache.get("clave")
+        with patch("app.core.cache.monotonic", return_value=61.0):
+            vencido = cache.get("clave")
+
+        # Assert
+        assert antes is None
+        assert vigente == b"pdf"
+        assert vencido is None
@@ -2,47 +2,52 @@
 Test para CalcularPromedioProfesorUseCase
 Aplicando principios de testing: AAA (Arrange, Act, Assert)
 """
-import pytest
 from unittest.mock import Mock
 
-from app.application.use_cases.calcular_promedio_profesor import CalcularPromedioProfesorUseCase
+import pytest
+
 from app.application.dtos.profesor_dtos import PromedioProfesorRequest
-from app.domain.entities.evaluacion import Evaluacion
-from app.domain.entities.pregunta import Pregunta
+from app.application.use_cases.calcular_promedio_profesor import CalcularPromedioProfesorUseCase
+from app.core.exceptions import ProfesorNotFoundError
 from app.domain.entities.categoria import Categoria
+from app.domain.entities.pregunta import Pregunta
 from app.domain.value_objects.calificacion import Calificacion
 from app.domain.value_objects.periodo import Periodo
-from app.core.exceptions import ProfesorNotFoundError
+from app.infrastructure.repositories.pandas_repository import PandasEvaluacionRepository
+
+# Preguntas y períodos compartidos: los tests no los modifican, así que se
+# construyen una sola vez por módulo
+_PREGUNTA_P364 = Pregunta(
+    codigo="P364",
+    categoria=Categoria.ENSENANZA_APRENDIZAJE,
+    texto="Pregunta de prueba"
+)
+_PREGUNTA_P376 = Pregunta(
+    codigo="P376",
+    categoria=Categoria.EVALUACION,
+    texto="Pregunta 1"
+)
+_PREGUNTA_P377 = Pregunta(
+    codigo="P377",
+    categoria=Categoria.EVALUACION,
+    texto="Pregunta 2"
+)
+_PERIODO_2025_1 = Periodo("2025-1")
+_PERIODO_2025_2 = Periodo("2025-2")
 
 
+# Los tests que solo verifican resultados usan el repositorio en memoria
+# real; Mock queda para los que verifican qué consultas se hacen
 class TestCalcularPromedioProfesorUseCase:
     """Test suite para el use case de cálculo de promedios"""
     
-    def test_calcula_promedio_con_una_evaluacion(self):
+    def test_calcula_promedio_con_una_evaluacion(self, crear_evaluacion):
         """Test: Calcula correctamente el promedio con una sola evaluación"""
         # Arrange
-        mock_repo = Mock()
-        
-        # Crear pregunta de prueba
-        pregunta = Pregunta(
-            codigo="P364",
-            categoria=Categoria.ENSENANZA_APRENDIZAJE,
-            texto="Pregunta de prueba"
-        )
-        
-        # Crear evaluación de prueba
-        evaluacion = Evaluacion(
-            id="1",
-            profesor_documento="123456",
-            profesor_nombre="Juan Pérez",
-            periodo=Periodo("2025-2"),
-            tipo_formulario="ESTUDIANTE V3"
-        )
-        evaluacion.agregar_respuesta(pregunta, Calificacion(4.5))
-        
-        mock_repo.find_by_profesor.return_value = [evaluacion]
+        evaluacion = crear_evaluacion("1")
+        evaluacion.agregar_respuesta(_PREGUNTA_P364, Calificacion(4.5))
         
-        use_case = CalcularPromedioProfesorUseCase(mock_repo)
+        use_case = CalcularPromedioProfesorUseCase(PandasEvaluacionRepository([evaluacion]))
         request = PromedioProfesorRequest(documento="123456")
         
         # Act
@@ -59,48 +64,28 @@ class TestCalcularPromedioProfesorUseCase:
     def test_lanza_excepcion_cuando_profesor_no_existe(self):
         """Test: Lanza ProfesorNotFoundError cuando no hay evaluaciones"""
         # Arrange
-        mock_repo = Mock()
-        mock_repo.find_by_profesor.return_value = []
-        
-        use_case = CalcularPromedioProfesorUseCase(mock_repo)
+        use_case = CalcularPromedioProfesorUseCase(PandasEvaluacionRepository([]))
         request = PromedioProfesorRequest(documento="999999")
         
         # Act & Assert
         with pytest.raises(ProfesorNotFoundError):
             use_case.execute(request)
     
-    def test_filtra_por_periodo_correctamente(self):
+    def test_filtra_por_periodo_correctamente(self, crear_evaluacion):
         """Test: Filtra evaluaciones por período cuando se especifica"""
         # Arrange
         mock_repo = Mock()
         
-        pregunta = Pregunta(
-            codigo="P364",
-            categoria=Categoria.ENSENANZA_APRENDIZAJE,
-            texto="Pregunta de prueba"
-        )
-        
         # Evaluación período 2025-1
-        eval1 = Evaluacion(
-            id="1",
-            profesor_documento="123456",
-            profesor_nombre="Juan Pérez",
-            periodo=Periodo("2025-1"),
-            tipo_formulario="ESTUDIANTE V3"
-        )
-        eval1.agregar_respuesta(pregunta, Calificacion(3.0))
+        eval1 = crear_evaluacion("1", _PERIODO_2025_1)
+        eval1.agregar_respuesta(_PREGUNTA_P364, Calificacion(3.0))
         
         # Evaluación período 2025-2
-        eval2 = Evaluacion(
-            id="2",
-            profesor_documento="123456",
-            profesor_nombre="Juan Pérez",
-            periodo=Periodo("2025-2"),
-            tipo_formulario="ESTUDIANTE V3"
-        )
-        eval2.agregar_respuesta(pregunta, Calificacion(5.0))
+        eval2 = crear_evaluacion("2", _PERIODO_2025_2)
+        eval2.agregar_respuesta(_PREGUNTA_P364, Calificacion(5.0))
         
-        mock_repo.find_by_profesor.return_value = [eval1, eval2]
+        mock_repo.find_by_profesor.return_value = (eval1, eval2)
+        mock_repo.find_by_profesor_and_periodo.return_value = (eval2,)
         
         use_case = CalcularPromedioProfesorUseCase(mock_repo)
         request = PromedioProfesorRequest(documento="123456", periodo="2025-2")
@@ -109,46 +94,88 @@ class TestCalcularPromedioProfesorUseCase:
         result = use_case.execute(request)
         
         # Assert
+        mock_repo.find_by_profesor_and_periodo.assert_called_once_with(
+            "123456", _PERIODO_2025_2
+        )
         assert result.periodo == "2025-2"
         assert result.promedio_general == 5.0  # Solo la eval2
         assert result.total_evaluaciones == 1
     
-    def test_agrupa_por_categoria_correctamente(self):
+    def test_agrupa_por_categoria_correctamente(self, crear_evaluacion):
         """Test: Agrupa y calcula promedios por categoría"""
         # Arrange
+        evaluacion = crear_evaluacion("1")
+        evaluacion.agregar_respuesta(_PREGUNTA_P364, Calificacion(4.0))
+        evaluacion.agregar_respuesta(_PREGUNTA_P376, Calificacion(5.0))
+        
+        use_case = CalcularPromedioProfesorUseCase(PandasEvaluacionRepository([evaluacion]))
+        request = PromedioProfesorRequest(documento="123456")
+        
+        # Act
+        result = use_case.execute(request)
+        
+        # Assert
+        assert len(result.promedios_por_categoria) == 2
+        categorias = [c.categoria_corta for c in result.promedios_por_categoria]
+        assert "Enseñanza-Aprendizaje" in categorias
+        assert "Evaluación" in categorias
+    
+    def test_precalcular_responde_sin_consultar_el_repositorio(self, crear_evaluacion):
+        """Test: Tras precalcular, execute usa la tabla sin volver al repositorio"""
+        # Arrange
         mock_repo = Mock()
         
-        pregunta1 = Pregunta(
-            codigo="P364",
-            categoria=Categoria.ENSENANZA_APRENDIZAJE,
-            texto="Pregunta 1"
-        )
-        pregunta2 = Pregunta(
-            codigo="P376",
-            categoria=Categoria.EVALUACION,
-            texto="Pregunta 2"
-        )
+        evaluacion = crear_evaluacion("1")
+        evaluacion.agregar_respuesta(_PREGUNTA_P364, Calificacion(4.0))
+        
+        mock_repo.get_profesores.return_value = [Mock(documento="123456")]
+        mock_repo.find_by_profesor.return_value = (evaluacion,)
+        
+        use_case = CalcularPromedioProfesorUseCase(mock_repo)
         
-        evaluacion = Evaluacion(
-            id="1",
-            profesor_documento="123456",
-            profesor_nombre="Juan Pérez",
-            periodo=Periodo("2025-2"),
-            tipo_formulario="ESTUDIANTE V3"
+        # Act
+        total = use_case.precalcular()
+        mock_repo.find_by_profesor.reset_mock()
+        result = use_case.execute(
+            PromedioProfesorRequest(documento="123456", periodo="2025-2")
         )
-        evaluacion.agregar_respuesta(pregunta1, Calificacion(4.0))
-        evaluacion.agregar_respuesta(pregunta2, Calificacion(5.0))
         
-        mock_repo.find_by_profesor.return_value = [evaluacion]
+        # Assert
+        assert total == 2
+        assert result.periodo == "2025-2"
+        assert result.promedio_general == 4.0
+        mock_repo.find_by_profesor.assert_not_called()
+    
+    def test_promedio_por_categoria_pondera_todas_las_respuestas(self, crear_evaluacion):
+        """Test: El promedio de categoría es suma/cantidad de todas las calificaciones"""
+        # Arrange
+        eval1 = crear_evaluacion("1")
+        eval1.agregar_respuesta(_PREGUNTA_P376, Calificacion(2.0))
+        eval1.agregar_respuesta(_PREGUNTA_P377, Calificacion(2.0))
+        
+        eval2 = crear_evaluacion("2")
+        eval2.agregar_respuesta(_PREGUNTA_P376, Calificacion(5.0))
         
-        use_case = CalcularPromedioProfesorUseCase(mock_repo)
+        use_case = CalcularPromedioProfesorUseCase(PandasEvaluacionRepository([eval1, eval2]))
         request = PromedioProfesorRequest(documento="123456")
         
         # Act
         result = use_case.execute(request)
         
         # Assert
-        assert len(result.promedios_por_categoria) == 2
-        categorias = [c.categoria_corta for c in result.promedios_por_categoria]
-        assert "Enseñanza-Aprendizaje" in categorias
-        assert "Evaluación" in categorias
+        categoria = result.promedios_por_categoria[0]
+        assert categoria.promedio == 3.0  # (2 + 2 + 5) / 3
+        assert categoria.total_evaluaciones == 2
+    
+    def test_periodo_con_formato_invalido_lanza_profesor_no_encontrado(self, crear_evaluacion):
+        """Test: Un período mal formado se trata como período sin evaluaciones"""
+        # Arrange
+        evaluacion = crear_evaluacion("1")
+        evaluacion.agregar_respuesta(_PREGUNTA_P364, Calificacion(4.0))
+        
+        use_case = CalcularPromedioProfesorUseCase(PandasEvaluacionRepository([evaluacion]))
+        request = PromedioProfesorRequest(documento="123456", periodo="2025")
+        
+        # Act & Assert
+        with pytest.raises(ProfesorNotFoundError):
+            use_case.execute(request)
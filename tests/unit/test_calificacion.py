@@ -0,0 +1,28 @@
+"""
+Test para el value object Calificacion
+Aplicando principios de testing: AAA (Arrange, Act, Assert)
+"""
+import pytest
+
+from app.core.exceptions import InvalidCalificacionError
+from app.domain.value_objects.calificacion import Calificacion
+
+
+class TestCalificacion:
+    """Test suite para Calificacion"""
+
+    def test_from_valor_reutiliza_la_instancia(self):
+        """Test: from_valor devuelve la misma instancia para el mismo valor"""
+        # Act
+        primera = Calificacion.from_valor(4.5)
+        segunda = Calificacion.from_valor(4.5)
+
+        # Assert
+        assert primera is segunda
+        assert primera == Calificacion(4.5)
+
+    def test_from_valor_valida_el_rango(self):
+        """Test: from_valor rechaza valores fuera de la escala 1-5"""
+        # Act & Assert
+        with pytest.raises(InvalidCalificacionError):
+            Calificacion.from_valor(0.5)
@@ -0,0 +1,146 @@
+"""
+Test para los parsers CSV y el data loader
+Aplicando principios de testing: AAA (Arrange, Act, Assert)
+"""
+import pytest
+
+from app.infrastructure.parsers.csv_parser import (
+    EvaluacionCSVParser,
+    EvaluacionDataLoader,
+    PreguntaCSVParser,
+)
+
+PREGUNTAS_CSV = (
+    "IDPREGUNTA;CATEGORIA;PREGUNTA\n"
+    "P1;EVALUACIÓN;Pregunta uno\n"
+    "P2;COMPONENTE PERSONAL;Pregunta dos\n"
+    "P3;COMENTARIOS;Comentario\n"
+)
+
+EVALUACIONES_CSV = (
+    "PEGE_ID;DOCUMENTO;NOMBRECOMPLETO;PERIODO;FORMULARIO;P1;P2;P3\n"
+    "1;123456;Juan Pérez;2025-2;ESTUDIANTE V3;4;5;texto libre\n"
+    "2;123456;Juan Pérez;2025-2;AUTOEVALUACIÓN V2;3;;\n"
+)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Directorio con un catálogo de preguntas y un archivo de evaluaciones"""
+    (tmp_path / "preguntas.csv").write_text(PREGUNTAS_CSV, encoding="latin-1")
+    (tmp_path / "Evaluacion2025-2.csv").write_text(EVALUACIONES_CSV, encoding="latin-1")
+    return tmp_path
+
+
+class TestEvaluacionDataLoader:
+    """Test suite para la carga de datos desde CSV"""
+
+    def test_carga_evaluaciones_y_preguntas(self, data_dir):
+        """Test: Convierte los CSV en entidades del dominio"""
+        # Arrange
+        loader = EvaluacionDataLoader(data_dir, data_dir / "preguntas.csv")
+
+        # Act
+        evaluaciones, preguntas = loader.load_all()
+
+        # Assert
+        assert len(preguntas) == 3
+        assert len(evaluaciones) == 2
+        assert evaluaciones[0].profesor_documento == "123456"
+        assert evaluaciones[0].calcular_promedio_general() == 4.5
+        assert evaluaciones[1].calcular_promedio_general() == 3.0
+
+    def test_cache_parquet_reproduce_la_carga_csv(self, data_dir):
+        """Test: La segunda carga usa la copia Parquet y obtiene los mismos datos"""
+        # Arrange
+        cache_dir = data_dir / ".cache"
+        loader = EvaluacionDataLoader(data_dir, data_dir / "preguntas.csv", cache_dir)
+
+        # Act
+        evaluaciones_csv, preguntas_csv = loader.load_all()
+        evaluaciones_cache, preguntas_cache = loader.load_all()
+
+        # Assert
+        assert len(list(cache_dir.glob("*.parquet"))) == 2
+        assert preguntas_cache == preguntas_csv
+        assert [e.id for e in evaluaciones_cache] == [e.id for e in evaluaciones_csv]
+        assert [e.respuestas for e in evaluaciones_cache] == [e.respuestas for e in evaluaciones_csv]
+
+    def test_data_version_cambia_si_cambian_los_archivos(self, data_dir):
+        """Test: La versión de datos refleja modificaciones en los CSV"""
+        # Arrange
+        loader = EvaluacionDataLoader(data_dir, data_dir / "preguntas.csv")
+        loader.load_all()
+        version_inicial = loader.data_version()
+
+        # Act
+        with open(data_dir / "Evaluacion2025-2.csv", "a", encoding="latin-1") as f:
+            f.write("3;654321;Ana Gómez;2025-2;ESTUDIANTE V3;5;5;\n")
+
+        # Assert
+        assert loader.data_version() == loader.data_version()
+        assert loader.data_version() != version_inicial
+
+    def test_invalidate_detecta_archivos_nuevos(self, data_dir):
+        """Test: El listado de archivos se conserva hasta invalidate()"""
+        # Arrange
+        loader = EvaluacionDataLoader(data_dir, data_dir / "preguntas.csv")
+        loader.load_all()
+        (data_dir / "Evaluacion2025-1.csv").write_text(EVALUACIONES_CSV, encoding="latin-1")
+
+        # Act
+        evaluaciones_snapshot, _ = loader.load_all()
+        loader.invalidate()
+        evaluaciones_nuevas, _ = loader.load_all()
+
+        # Assert
+        assert len(evaluaciones_snapshot) == 2
+        assert len(evaluaciones_nuevas) == 4
+
+    def test_descarta_filas_con_calificaciones_fuera_de_rango(self, data_dir):
+        """Test: Una calificación inválida descarta la fila; vacías y texto quedan en None"""
+        # Arrange
+        with open(data_dir / "Evaluacion2025-2.csv", "a", encoding="latin-1") as f:
+            f.write("3;654321;Ana Gómez;2025-2;ESTUDIANTE V3;7;5;\n")
+        loader = EvaluacionDataLoader(data_dir, data_dir / "preguntas.csv")
+
+        # Act
+        evaluaciones, _ = loader.load_all()
+
+        # Assert
+        assert [e.id for e in evaluaciones] == ["1", "2"]
+        assert [c.valor if c else None for c in evaluaciones[1].respuestas.values()] == [3.0, None, None]
+
+    def test_lee_solo_columnas_de_metadatos_y_preguntas(self, data_dir):
+        """Test: Las columnas ajenas al catálogo no se cargan"""
+        # Arrange
+        (data_dir / "Evaluacion2025-2.csv").write_text(
+            "PEGE_ID;DOCUMENTO;NOMBRECOMPLETO;PERIODO;FORMULARIO;OBSERVACION;P1\n"
+            "1;123456;Juan Pérez;2025-2;ESTUDIANTE V3;sin novedad;4\n",
+            encoding="latin-1",
+        )
+        parser = EvaluacionCSVParser(
+            data_dir / "Evaluacion2025-2.csv",
+            PreguntaCSVParser(data_dir / "preguntas.csv").parse(),
+        )
+
+        # Act
+        evaluaciones = parser.parse()
+
+        # Assert
+        assert "OBSERVACION" not in parser._df.columns
+        assert [p.codigo for p in evaluaciones[0].respuestas] == ["P1"]
+
+    def test_parse_iter_por_bloques_equivale_a_parse(self, data_dir):
+        """Test: Convertir por bloques produce las mismas evaluaciones"""
+        # Arrange
+        preguntas = PreguntaCSVParser(data_dir / "preguntas.csv").parse()
+        parser = EvaluacionCSVParser(data_dir / "Evaluacion2025-2.csv", preguntas)
+
+        # Act
+        por_bloques = list(parser.parse_iter(chunksize=1))
+        completas = parser.parse()
+
+        # Assert
+        assert [e.id for e in por_bloques] == [e.id for e in completas]
+        assert [e.respuestas for e in por_bloques] == [e.respuestas for e in completas]
@@ -0,0 +1,88 @@
+"""
+Test para la entidad Evaluacion
+Aplicando principios de testing: AAA (Arrange, Act, Assert)
+"""
+from app.domain.entities.categoria import Categoria
+from app.domain.entities.pregunta import Pregunta
+from app.domain.entities.tipo_actor import TipoActor
+from app.domain.value_objects.calificacion import Calificacion
+
+
+class TestEvaluacion:
+    """Test suite para los cálculos de la entidad Evaluacion"""
+
+    def test_promedios_tras_freeze_ignoran_comentarios_y_vacias(self, crear_evaluacion):
+        """Test: Los promedios precalculados excluyen comentarios y respuestas vacías"""
+        # Arrange
+        evaluacion = crear_evaluacion()
+        evaluacion.agregar_respuesta(Pregunta("P1", Categoria.EVALUACION, "Uno"), Calificacion(4.0))
+        evaluacion.agregar_respuesta(Pregunta("P2", Categoria.EVALUACION, "Dos"), None)
+        evaluacion.agregar_respuesta(Pregunta("P3", Categoria.COMPONENTE_PERSONAL, "Tres"), Calificacion(5.0))
+        evaluacion.agregar_respuesta(Pregunta("P4", Categoria.COMENTARIOS, "Cuatro"), Calificacion(1.0))
+
+        # Act
+        evaluacion.freeze()
+
+        # Assert
+        assert evaluacion.calcular_promedio_general() == 4.5
+        assert evaluacion.calcular_promedio_por_categoria(Categoria.EVALUACION) == 4.0
+        assert evaluacion.calcular_promedio_por_categoria(Categoria.POSGRADO) == 0.0
+
+    def test_agregar_respuesta_invalida_las_sumas(self, crear_evaluacion):
+        """Test: Agregar una respuesta después de freeze actualiza los promedios"""
+        # Arrange
+        evaluacion = crear_evaluacion()
+        evaluacion.agregar_respuesta(Pregunta("P1", Categoria.EVALUACION, "Uno"), Calificacion(4.0))
+        evaluacion.freeze()
+
+        # Act
+        evaluacion.agregar_respuesta(Pregunta("P2", Categoria.EVALUACION, "Dos"), Calificacion(2.0))
+
+        # Assert
+        assert evaluacion.calcular_promedio_general() == 3.0
+
+    def test_categorias_evaluadas_se_actualizan_tras_agregar_respuesta(self, crear_evaluacion):
+        """Test: Las categorías cacheadas excluyen comentarios y se recalculan"""
+        # Arrange
+        evaluacion = crear_evaluacion()
+        evaluacion.agregar_respuesta(Pregunta("P1", Categoria.EVALUACION, "Uno"), Calificacion(4.0))
+        evaluacion.agregar_respuesta(Pregunta("P2", Categoria.COMENTARIOS, "Dos"), None)
+        evaluacion.freeze()
+
+        # Act
+        antes = evaluacion.categorias_evaluadas()
+        evaluacion.agregar_respuesta(Pregunta("P3", Categoria.POSGRADO, "Tres"), None)
+        despues = evaluacion.categorias_evaluadas()
+
+        # Assert
+        assert antes == {Categoria.EVALUACION}
+        assert despues == {Categoria.EVALUACION, Categoria.POSGRADO}
+
+    def test_tipo_actor_se_clasifica_desde_el_formulario(self, crear_evaluacion):
+        """Test: El tipo de actor se deriva del tipo de formulario sin importar mayúsculas"""
+        # Arrange
+        evaluacion = crear_evaluacion()
+        autoevaluacion = crear_evaluacion("2", tipo_formulario="Autoevaluación V2")
+
+        # Assert
+        assert evaluacion.tipo_actor == TipoActor.ESTUDIANTE
+        assert evaluacion.es_evaluacion_estudiante()
+        assert autoevaluacion.es_autoevaluacion()
+        assert not autoevaluacion.es_evaluacion_estudiante()
+
+    def test_obtener_respuestas_por_categoria_usa_solo_calificadas(self, crear_evaluacion):
+        """Test: Las respuestas por categoría excluyen vacías y otras categorías"""
+        # Arrange
+        evaluacion = crear_evaluacion()
+        p1 = Pregunta("P1", Categoria.EVALUACION, "Uno")
+        evaluacion.agregar_respuesta(p1, Calificacion(4.0))
+        evaluacion.agregar_respuesta(Pregunta("P2", Categoria.EVALUACION, "Dos"), None)
+        evaluacion.agregar_respuesta(Pregunta("P3", Categoria.POSGRADO, "Tres"), Calificacion(5.0))
+        evaluacion.freeze()
+
+        # Act
+        respuestas = evaluacion.obtener_respuestas_por_categoria(Categoria.EVALUACION)
+
+        # Assert
+        assert respuestas == {p1: Calificacion(4.0)}
+        assert evaluacion.obtener_respuestas_por_categoria(Categoria.COMENTARIOS) == {}
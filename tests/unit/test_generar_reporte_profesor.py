@@ -0,0 +1,43 @@
+"""
+Test para ReporteProfesorUseCase
+Aplicando principios de testing: AAA (Arrange, Act, Assert)
+"""
+from unittest.mock import Mock
+
+from app.application.dtos.reporte_dtos import ReporteProfesorRequest
+from app.application.use_cases.generar_reporte_profesor import ReporteProfesorUseCase
+from app.domain.entities.categoria import Categoria
+from app.domain.entities.pregunta import Pregunta
+from app.domain.value_objects.calificacion import Calificacion
+from app.domain.value_objects.periodo import Periodo
+
+
+class TestReporteProfesorUseCase:
+    """Test suite para el use case del reporte completo"""
+
+    def test_consulta_el_repositorio_una_sola_vez(self, crear_evaluacion):
+        """Test: Calcula promedios y mejoras con una única búsqueda de evaluaciones"""
+        # Arrange
+        mock_repo = Mock()
+        pregunta = Pregunta(
+            codigo="P364",
+            categoria=Categoria.ENSENANZA_APRENDIZAJE,
+            texto="Utiliza recursos didácticos"
+        )
+        evaluacion = crear_evaluacion()
+        evaluacion.agregar_respuesta(pregunta, Calificacion(3.0))
+        mock_repo.find_by_profesor_and_periodo.return_value = [evaluacion]
+
+        use_case = ReporteProfesorUseCase(mock_repo, Mock())
+        request = ReporteProfesorRequest(documento="123456", periodo="2025-2")
+
+        # Act
+        result = use_case.execute(request)
+
+        # Assert
+        mock_repo.find_by_profesor_and_periodo.assert_called_once_with(
+            "123456", Periodo("2025-2")
+        )
+        assert result.promedios.promedio_general == 3.0
+        assert result.mejoras.nombre_completo == "Juan Pérez"
+        assert len(result.mejoras.categorias_a_mejorar) == 1
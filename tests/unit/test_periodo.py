@@ -0,0 +1,37 @@
+"""
+Test para el value object Periodo
+Aplicando principios de testing: AAA (Arrange, Act, Assert)
+"""
+import pytest
+
+from app.domain.value_objects.periodo import Periodo
+
+
+class TestPeriodo:
+    """Test suite para Periodo"""
+
+    def test_from_string_reutiliza_la_instancia(self):
+        """Test: from_string devuelve la misma instancia para el mismo valor"""
+        # Act
+        primero = Periodo.from_string("2025-2")
+        segundo = Periodo.from_string("2025-2")
+
+        # Assert
+        assert primero is segundo
+        assert primero == Periodo("2025-2")
+
+    def test_from_string_valida_el_formato(self):
+        """Test: from_string rechaza períodos inválidos"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            Periodo.from_string("2025-3")
+
+    def test_anio_y_semestre_se_extraen_del_valor(self):
+        """Test: Año y semestre se derivan del valor y permiten ordenar"""
+        # Act
+        periodo = Periodo("2024-2")
+
+        # Assert
+        assert (periodo.anio, periodo.semestre) == (2024, 2)
+        assert sorted([Periodo("2025-1"), periodo]) == [periodo, Periodo("2025-1")]
+        assert not Periodo.es_valido("2025-12")
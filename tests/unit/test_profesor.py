@@ -0,0 +1,23 @@
+"""
+Test para la entidad Profesor
+Aplicando principios de testing: AAA (Arrange, Act, Assert)
+"""
+from app.domain.entities.profesor import Profesor
+
+
+class TestProfesor:
+    """Test suite para el agregado Profesor"""
+
+    def test_agregar_evaluacion_ignora_ids_repetidos(self, crear_evaluacion):
+        """Test: Una evaluación con ID ya agregado no se duplica"""
+        # Arrange
+        profesor = Profesor("123456", "Juan Pérez", evaluaciones=[crear_evaluacion("1")])
+
+        # Act
+        profesor.agregar_evaluacion(crear_evaluacion("1"))
+        profesor.agregar_evaluacion(crear_evaluacion("2"))
+        profesor.agregar_evaluacion(crear_evaluacion("2"))
+
+        # Assert
+        assert [e.id for e in profesor.evaluaciones] == ["1", "2"]
+        assert profesor.total_evaluaciones() == 2